@@ -1,6 +1,7 @@
 """utility imports"""
 from utilities.data import read_lines, parse_integers
 from utilities.runner import runner
+from utilities.sweep import sweep
 
 @runner("Day 2", "Part 1")
 def solve_part1(line: str):
@@ -14,15 +15,19 @@ def solve_part1(line: str):
 def solve_part2(line: str):
     """part 2 solving function"""
     pgm = parse_integers(line, ",")
-    for noun in range(100):
-        for verb in range(100):
-            opcodes = list(pgm)
-            opcodes[1] = noun
-            opcodes[2] = verb
-            o = run_program(opcodes)
-            if o == 19690720:
-                return (100 * noun) + verb
-    return 0
+    cases = [(noun, verb) for noun in range(100) for verb in range(100)]
+    # run in process: the script has no entry point guard for pool workers
+    found = sweep(pgm, noun_verb_output, cases, 19690720, workers=1)
+    if len(found) == 0:
+        return 0
+    (noun, verb), _ = found[0]
+    return (100 * noun) + verb
+
+def noun_verb_output(pgm: list[int], noun_verb: tuple[int,int]) -> int:
+    """run the intcode program with the supplied noun and verb"""
+    opcodes = list(pgm)
+    opcodes[1], opcodes[2] = noun_verb
+    return run_program(opcodes)
 
 def run_program(opcodes: list[int]) -> int:
     """run the intcode program and return value"""
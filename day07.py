@@ -1,6 +1,9 @@
 """utility imports"""
+from functools import partial
 from utilities.data import read_lines, parse_integers
 from utilities.runner import runner
+from utilities.intcode import Computer, SignalIO, OUTPUT, HALT
+from utilities.sweep import sweep
 
 @runner("Day 7", "Part 1")
 def solve_part1(line: str):
@@ -33,8 +36,8 @@ def phase_sequences(min_phase: int, max_phase: int, to_assign: int, values: tupl
 def max_output_signal(opcodes: list[int], sequences: set, loop: bool) -> int:
     """find the maximum output signal"""
     max_output = 0
-    for seq in sequences:
-        os = output_signal(opcodes, seq, loop)
+    # run in process: the script has no entry point guard for pool workers
+    for _, os in sweep(opcodes, partial(output_signal, loop=loop), list(sequences), workers=1):
         if os > max_output:
             max_output = os
     return max_output
@@ -43,93 +46,18 @@ def output_signal(opcodes: list[int], phases: set, loop: bool) -> int:
     """compute the output signal for the phase sequence"""
     amps = []
     for phase in phases:
-        amp = Amplifier(list(opcodes))
-        amp.in_signals.append(phase)
-        amps.append(amp)
-    for i in range(1,len(amps)):
-        amps[i-1].out_signals = amps[i].in_signals
-    if loop:
-        amps[-1].out_signals = amps[0].in_signals
-    amps[0].in_signals.append(0)
+        io = SignalIO()
+        io.send([phase])
+        amps.append(Computer(opcodes, io))
+    signal = 0
     while True:
-        alldone = True
         for amp in amps:
-            if amp.done:
-                continue
-            alldone = False
-            amp.run()
-        if alldone:
-            break
-    return amps[-1].out_signals[-1]
-
-class Amplifier:
-    """structure for amplifier"""
-    def __init__(self, op: list[int]):
-        self.op = op
-        self.in_signals = []
-        self.out_signals = []
-        self.opi = 0
-        self.done = False
-
-    def run(self):
-        """run the intcode program and return value"""
-        i = self.opi
-        while i < len(self.op):
-            opcode, m1, m2, _ = opcode_modes(self.op[i])
-            if opcode == 99:
-                self.done = True
-                break
-            if opcode == 1:
-                self.op[pv(self.op,i+3,1)] = pv(self.op,i+1,m1) + pv(self.op,i+2,m2)
-                i += 4
-            elif opcode == 2:
-                self.op[pv(self.op,i+3,1)] = pv(self.op,i+1,m1) * pv(self.op,i+2,m2)
-                i += 4
-            elif opcode == 3:
-                if len(self.in_signals) == 0:
-                    break
-                self.op[pv(self.op,i+1,1)] = self.in_signals.pop(0)
-                i += 2
-            elif opcode == 4:
-                self.out_signals.append(pv(self.op,i+1,m1))
-                i += 2
-            elif opcode == 5:
-                if pv(self.op,i+1,m1) != 0:
-                    i = pv(self.op,i+2,m2)
-                else:
-                    i += 3
-            elif opcode == 6:
-                if pv(self.op,i+1,m1) == 0:
-                    i = pv(self.op,i+2,m2)
-                else:
-                    i += 3
-            elif opcode == 7:
-                self.op[pv(self.op,i+3,1)] = 1 if pv(self.op,i+1,m1) < pv(self.op,i+2,m2) else 0
-                i += 4
-            elif opcode == 8:
-                self.op[pv(self.op,i+3,1)] = 1 if pv(self.op,i+1,m1) == pv(self.op,i+2,m2) else 0
-                i += 4
-        self.opi = i
-
-def opcode_modes(o: int) -> tuple[int,int,int,int]:
-    """parse opcode and modes from input"""
-    mode3 = 0
-    if o > 10000:
-        mode3 = 1
-        o -= 10000
-    mode2 = 0
-    if o > 1000:
-        mode2 = 1
-        o -= 1000
-    mode1 = 0
-    if o > 100:
-        mode1 = 1
-        o -= 100
-    return o, mode1, mode2, mode3
-
-def pv(opcodes: list[int], idx: int, mode: int) -> int:
-    """determine proper param value based on index and mode"""
-    return opcodes[opcodes[idx]] if mode == 0 else opcodes[idx]
+            amp.io.send([signal])
+            if amp.run_until(OUTPUT) == HALT:
+                return signal
+            signal = amp.io.out_signals.popleft()
+        if not loop:
+            return signal
 
 # Data
 data = read_lines("input/day07/input.txt")[0]
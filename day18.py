@@ -1,15 +1,13 @@
 """utility imports"""
-from typing import Self
 from utilities.data import read_lines
 from utilities.runner import runner
-from utilities.search import Search, Searcher, SearchMove
+from utilities.search import PriorityQueue, Search, SearchMove
+from utilities.graph import contract, GraphSearcher
 
 @runner("Day 18", "Part 1")
 def solve_part1(lines: list[str]) -> int:
     """part 1 solving function"""
-    cave = Cave(lines)
-    keys = set(cave.keys_by_name)
-    return best_key_path([KeyState(cave, '@', keys)], keys, {})
+    return best_key_path([Cave(lines)])
 
 @runner("Day 18", "Part 2")
 def solve_part2(lines: list[str]) -> int:
@@ -21,15 +19,10 @@ def solve_part2(lines: list[str]) -> int:
     lines[vm-1] = lines[vm-1][:hm-1] + "@#@" + lines[vm-1][hm+2:]
     lines[vm] = lines[vm][:hm-1] + "###" + lines[vm][hm+2:]
     lines[vm+1] = lines[vm+1][:hm-1] + "@#@" + lines[vm+1][hm+2:]
-    all_keys = set()
-    cave_states = []
+    caves = []
     for hs, he, vs, ve in [(0,hm+1,0,vm+1),(hm,hl,0,vm+1),(0,hm+1,vm,vl),(hm,hl,vm,vl)]:
-        cl = extract_cave(lines, hs, he, vs, ve)
-        cave = Cave(cl)
-        cave_keys = set(cave.keys_by_name)
-        all_keys.update(cave_keys)
-        cave_states.append(KeyState(cave, '@', cave_keys))
-    return best_key_path(cave_states, all_keys, {})
+        caves.append(Cave(extract_cave(lines, hs, he, vs, ve)))
+    return best_key_path(caves)
 
 def extract_cave(lines: list[str], hs: int, he: int, vs: int, ve: int) -> list[str]:
     """extract cave quadraunt"""
@@ -42,7 +35,7 @@ class Cave:
     """structure representing the cave details of the problem space"""
     def __init__(self, lines: list[str]) -> None:
         self.path_maps = None
-        self.walls = set()
+        self.spaces = set()
         self.keys_by_name = {}
         self.doors = {}
         self.start = None
@@ -50,8 +43,9 @@ class Cave:
             for x, c in enumerate(line):
                 l = (x,y)
                 if c == '#':
-                    self.walls.add(l)
-                elif c == '@':
+                    continue
+                self.spaces.add(l)
+                if c == '@':
                     self.start = l
                 elif c.isalpha():
                     if c.islower():
@@ -60,21 +54,27 @@ class Cave:
                         self.doors[l] = c
 
     def map_paths(self) -> dict[chr,dict[chr,tuple[int,list[str]]]]:
-        """map all optimal paths and door blockers"""
+        """map all optimal paths and door blockers, with a single sweep
+        from the start and from each key over the cave's corridor graph
+        (doors are nodes of the graph so each path lists those crossed)"""
         if self.path_maps is not None:
             return self.path_maps
         keys = ['@']
         keys.extend(self.keys_by_name.keys())
+        names = {self.key_location(k): k for k in keys}
+        graph = contract(self.spaces, set(names) | set(self.doors))
+        search = Search(GraphSearcher(graph, None))
         path_maps = {}
-        for offset, a in enumerate(keys):
-            for b in keys[offset+1:]:
-                a_loc = self.key_location(a)
-                b_loc = self.key_location(b)
-                solution = self.steps_and_doors(a_loc, b_loc)
-                if solution is None:
+        for a in keys:
+            solutions = search.sweep(SearchMove(0, self.key_location(a)), set(names))
+            for loc, solution in solutions.items():
+                if names[loc] == a:
                     continue
-                self.add_path_entry(path_maps, a, b, solution)
-                self.add_path_entry(path_maps, b, a, solution)
+                doors = []
+                for p in solution.path:
+                    if p in self.doors:
+                        doors.append(self.doors[p])
+                self.add_path_entry(path_maps, a, names[loc], (solution.cost, doors))
         self.path_maps = path_maps
         return path_maps
 
@@ -84,107 +84,65 @@ class Cave:
             return self.start
         return self.keys_by_name[key]
 
+    def key_edges(self, keys: int) -> dict[chr,list[tuple[chr,int,int,int]]]:
+        """paths from the start and each key to every other key as (key, key
+        bit, steps, mask of the keys opening the doors on the way). doors
+        whose key is not in the supplied mask never block"""
+        edges = {}
+        for f, paths in self.map_paths().items():
+            edges[f] = []
+            for t, (steps, doors) in paths.items():
+                if t == '@':
+                    continue
+                needed = 0
+                for door in doors:
+                    needed |= key_bit(door.lower())
+                edges[f].append((t, key_bit(t), steps, needed & keys))
+        return edges
+
     def add_path_entry(self, pm: dict, f: chr, t: chr, entry: tuple[int,list[str]]) -> None:
         """add path entry for from/to"""
         from_paths = pm.get(f, {})
         from_paths[t] = entry
         pm[f] = from_paths
 
-    def steps_and_doors(self, s: tuple[int,int], e: tuple[int,int]) -> tuple[int,list[str]]:
-        """determine the optimal path between two locations and the doors between"""
-        ps = PathSearcher(self.walls, e)
-        search = Search(ps)
-        solution = search.best(SearchMove(0,s))
-        if solution is None:
-            return None
-        doors = []
-        for p in solution.path:
-            if p in self.doors:
-                doors.append(self.doors[p])
-        return (solution.cost, doors)
-
-class PathSearcher(Searcher):
-    """path search implementation for the area"""
-    def __init__(self, walls: set[tuple[int,int]], goal: tuple[int,int]) -> None:
-        self.walls = walls
-        self.goal = goal
-
-    def is_goal(self, obj: tuple[int,int]) -> bool:
-        """determine if the supplied state is the goal location"""
-        return obj == self.goal
-
-    def possible_moves(self, obj: tuple[int,int]) -> list[SearchMove]:
-        """determine possible moves from curent location"""
-        moves = []
-        for m in [(1,0),(-1,0),(0,1),(0,-1)]:
-            loc = (obj[0] + m[0], obj[1] + m[1])
-            if loc in self.walls:
-                continue
-            moves.append(SearchMove(1,loc))
-        return moves
-
-    def distance_from_goal(self, obj: tuple[int,int]) -> int:
-        """calculate distance from the goal"""
-        return abs(self.goal[0]-obj[0]) + abs(self.goal[1]-obj[1])
-
-class KeyState:
-    """structure to represent the state of key collection in a cave"""
-    def __init__(self, cave: Cave, loc: chr, keys: set[chr]):
-        self.cave = cave
-        self.loc = loc
-        self.keys = frozenset(keys)
-
-    def state_at_key(self, key: chr) -> Self:
-        """return new state to represent location at supplied key"""
-        nloc = key
-        nkeys = set(self.keys)
-        nkeys.remove(key)
-        return KeyState(self.cave, nloc, nkeys)
-
-    def potential_moves(self, outstanding_keys: set[chr]) -> tuple[int,chr]:
-        """based on the current state, determine next potential moves"""
-        paths = self.cave.map_paths()[self.loc]
-        moves = []
-        for loc, (steps, doors) in paths.items():
-            if loc not in outstanding_keys:
-                continue
-            blocked = False
-            for door in doors:
-                if door.lower() in outstanding_keys:
-                    blocked = True
-                    break
-            if not blocked:
-                moves.append((steps, loc))
-        return moves
-
-def best_key_path(states: list[KeyState], outstanding_keys: set[chr], cache: dict) -> int:
-    """find the best path from the supplied location to retrieve all keys"""
-    ck = cache_key(states, outstanding_keys)
-    if ck in cache:
-        return cache[ck]
-    moves = []
-    for i, state in enumerate(states):
-        for cost, key in state.potential_moves(outstanding_keys):
-            moves.append((i,cost,key))
-    steps = 0
-    for i, cost, key in moves:
-        new_states = states[:]
-        new_states[i] = states[i].state_at_key(key)
-        new_keys = set(outstanding_keys)
-        new_keys.remove(key)
-        ccost = best_key_path(new_states, new_keys, cache)
-        if steps == 0 or cost + ccost < steps:
-            steps = cost + ccost
-    cache[ck] = steps
-    return steps
-
-def cache_key(states: list[KeyState], outstanding_keys: set[chr]) -> tuple:
-    """build cache key for list of states and needed keys"""
-    ck = []
-    for state in states:
-        ck.append(state.loc)
-    ck.append(frozenset(outstanding_keys))
-    return tuple(ck)
+def key_bit(key: chr) -> int:
+    """bit representing a key in a mask of keys"""
+    return 1 << (ord(key) - ord('a'))
+
+def best_key_path(caves: list[Cave]) -> int:
+    """find the fewest steps to collect every key, with a robot starting
+    at the entrance of each cave. dijkstra over states of the robot
+    locations and the mask of keys collected"""
+    keys = 0
+    for cave in caves:
+        for key in cave.keys_by_name:
+            keys |= key_bit(key)
+    edges = [cave.key_edges(keys) for cave in caves]
+    start = (('@',) * len(caves), 0)
+    cost = {start: 0}
+    closed = set()
+    q = PriorityQueue()
+    q.queue(start, 0)
+    while not q.empty():
+        state = q.next()
+        if state in closed:
+            continue
+        closed.add(state)
+        locs, collected = state
+        steps = cost[state]
+        if collected == keys:
+            return steps
+        for i, loc in enumerate(locs):
+            for key, bit, distance, needed in edges[i].get(loc, []):
+                if collected & bit or needed & ~collected:
+                    continue
+                nstate = (locs[:i] + (key,) + locs[i+1:], collected | bit)
+                nsteps = steps + distance
+                if nstate not in cost or nsteps < cost[nstate]:
+                    cost[nstate] = nsteps
+                    q.queue(nstate, nsteps)
+    return 0
 
 # Data
 data = read_lines("input/day18/input.txt")
@@ -1,58 +1,148 @@
 """utility imports"""
 from utilities.data import read_lines, parse_integers
 from utilities.runner import runner
+from utilities.intcode import Computer, ComputerIO
 
 @runner("Day 19", "Part 1")
 def solve_part1(line: str, grid_size: int) -> int:
     """part 1 solving function"""
-    oc = parse_integers(line, ",")
-    impact_points = 0
-    for y in range(grid_size):
-        for x in range(grid_size):
-            if in_beam(oc, x, y):
-                impact_points += 1
-    return impact_points
+    scanner = BeamScanner(beam_computer(parse_integers(line, ",")))
+    return scanner.scan(grid_size)
 
 @runner("Day 19", "Part 2")
 def solve_part2(line: str) -> int:
     """part 2 solving function"""
-    oc = parse_integers(line, ",")
-    x, y = 500, 1000 # educated guess based on looking at beam early path
-    prev_match = None
-    while True:
-        tl, tr, bl = fits_ship(oc, x, y)
-        #print(f"x/y: ({x},{y}), top_left: {tl}, top_right: {tr}, bottom_left: {bl}")
-        if tl and tr and bl:
-            if prev_match == (x,y):
-                break
-            prev_match = (x,y)
-            x -= 1
-            y -= 1
-        if not tl:
+    scanner = BeamScanner(beam_computer(parse_integers(line, ",")))
+    scanner.scan(50)
+    # gallop down the rows until the ship fits, then bisect back to the
+    # first row it fits in
+    y = 100
+    while not scanner.fits(y):
+        y *= 2
+    lo, hi = y // 2, y
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if scanner.fits(mid):
+            hi = mid
+        else:
+            lo = mid
+    # row edges move in uneven steps, so make sure no row just above fits
+    while scanner.fits(hi - 1):
+        hi -= 1
+    x = scanner.edges(hi + 99)[0]
+    print(f"beam probes: {scanner.probes}, row cache hit rate: {scanner.hit_rate():0.2f}")
+    return (x * 10000) + hi
+
+class BeamScanner:
+    """tracks the left and right edge of beam rows. the beam only widens and
+    drifts right further down, so each row is found from its edges rather
+    than by probing every point of it"""
+    def __init__(self, beam: Computer):
+        self.beam = beam
+        self.rows = {}
+        self.probes = 0
+        self.lookups = 0
+        self.hits = 0
+
+    def probe(self, x: int, y: int) -> bool:
+        """determines if point is within the beam, counting the probe"""
+        self.probes += 1
+        return in_beam(self.beam, x, y)
+
+    def scan(self, size: int) -> int:
+        """count the points in the beam within a size by size grid, walking
+        each row's edges on from the previous row's (rows near the emitter
+        may miss the grid points entirely)"""
+        left, right = 0, 0
+        points = 0
+        for y in range(size):
+            x = left
+            while x < size and not self.probe(x, y):
+                x += 1
+            if x == size:
+                continue
+            left = x
+            if right > left and self.probe(right, y):
+                x = right
+            while x + 1 < size and self.probe(x + 1, y):
+                x += 1
+            right = x
+            self.rows[y] = (left, right)
+            points += right - left + 1
+        return points
+
+    def edges(self, y: int) -> tuple[int,int]:
+        """left and right edge of a row. the beam is a cone from the emitter,
+        so each edge is extrapolated from the nearest known row and stepped
+        to the exact edge, usually a probe or two each. the walk to the left
+        edge stops at the right edge's estimate, falling back to scanning
+        the row when the estimates miss the beam. rows are cached, as the
+        fit checks query the same rows repeatedly"""
+        self.lookups += 1
+        if y in self.rows:
+            self.hits += 1
+            return self.rows[y]
+        ry = min(self.rows, key=lambda r: abs(r - y))
+        rl, rr = self.rows[ry]
+        left, right = rl * y // ry, rr * y // ry
+        if self.probe(left, y):
+            while left > 0 and self.probe(left - 1, y):
+                left -= 1
+        else:
+            left += 1
+            while left <= right and not self.probe(left, y):
+                left += 1
+            if left > right:
+                return self.scan_row(y, 2 * (right + y))
+        if self.probe(right, y):
+            while self.probe(right + 1, y):
+                right += 1
+        else:
+            # the beam runs on from the left edge, so this stops there at worst
+            right -= 1
+            while not self.probe(right, y):
+                right -= 1
+        self.rows[y] = (left, right)
+        return self.rows[y]
+
+    def scan_row(self, y: int, size: int) -> tuple[int,int]:
+        """left and right edge of a row found by probing its first size
+        points in turn"""
+        x = 0
+        while x < size and not self.probe(x, y):
             x += 1
-            y += 1
-        if not bl:
+        if x == size:
+            raise ValueError(f"no beam in the first {size} points of row {y}")
+        left = x
+        while self.probe(x + 1, y):
             x += 1
-        if not tr:
-            y += 1
-    return (x * 10000) + y
-
-def fits_ship(oc: list[int], x: int, y: int) -> tuple[bool,bool,bool]:
-    """determine if the ship will fit in tractor beam at supplied coords"""
-    tl = in_beam(oc, x, y)
-    tr = in_beam(oc, x+99, y)
-    bl = in_beam(oc, x, y+99)
-    return (tl,tr,bl)
-
-def in_beam(oc: list[int], x: int, y: int) -> bool:
+        self.rows[y] = (left, x)
+        return self.rows[y]
+
+    def hit_rate(self) -> float:
+        """fraction of row lookups answered from the cache"""
+        return self.hits / self.lookups if self.lookups > 0 else 0.0
+
+    def fits(self, y: int) -> bool:
+        """determine if the ship fits in the beam with its top row at y"""
+        return self.edges(y)[1] - self.edges(y + 99)[0] >= 99
+
+def beam_computer(oc: list[int]) -> Computer:
+    """run the drone program up to its first coordinate request and
+    snapshot it so each probe can fork from there"""
+    computer = Computer(oc, ComputerIO())
+    computer.run()
+    return computer.snapshot()
+
+def in_beam(beam: Computer, x: int, y: int) -> bool:
     """determines if point is within the beam"""
     io = IOProvider()
     io.coords = [x, y]
-    computer = Computer(oc, io)
+    computer = beam.fork(io)
     computer.run()
     return io.output_val == 1
 
-class IOProvider:
+class IOProvider(ComputerIO):
     """structure for fixing robot"""
     def __init__(self):
         self.coord_idx = 0
@@ -69,103 +159,6 @@ class IOProvider:
         """accept output value and record mapping actions accordingly"""
         self.output_val = o
 
-    def halt_program(self) -> bool:
-        """exit point to stop program"""
-        return False
-
-class Computer:
-    """structure for computer"""
-    def __init__(self, op: list[int], io: IOProvider):
-        self.op = {i:o for i, o in enumerate(op)}
-        self.io = io
-        self.opi = 0
-        self.relative_base = 0
-        self.done = False
-
-    def run(self) -> bool:
-        """run the intcode program and return value"""
-        i = self.opi
-        while i < len(self.op):
-            opcode, m1, m2, m3 = self.opcode_modes(self.opc(i))
-            if opcode == 99 or self.io.halt_program():
-                self.done = True
-                break
-            if opcode == 1:
-                self.op[self.pvi(i+3,m3)] = self.pv(i+1,m1) + self.pv(i+2,m2)
-                i += 4
-            elif opcode == 2:
-                self.op[self.pvi(i+3,m3)] = self.pv(i+1,m1) * self.pv(i+2,m2)
-                i += 4
-            elif opcode == 3:
-                self.op[self.pvi(i+1,m1)] = self.io.provide_input()
-                i += 2
-            elif opcode == 4:
-                self.io.accept_output(self.pv(i+1,m1))
-                i += 2
-            elif opcode == 5:
-                if self.pv(i+1,m1) != 0:
-                    i = self.pv(i+2,m2)
-                else:
-                    i += 3
-            elif opcode == 6:
-                if self.pv(i+1,m1) == 0:
-                    i = self.pv(i+2,m2)
-                else:
-                    i += 3
-            elif opcode == 7:
-                self.op[self.pvi(i+3,m3)] = 1 if self.pv(i+1,m1) < self.pv(i+2,m2) else 0
-                i += 4
-            elif opcode == 8:
-                self.op[self.pvi(i+3,m3)] = 1 if self.pv(i+1,m1) == self.pv(i+2,m2) else 0
-                i += 4
-            elif opcode == 9:
-                self.relative_base += self.pv(i+1,m1)
-                i += 2
-        self.opi = i
-
-    def opc(self, i: int) -> int:
-        """get the value of supplied index"""
-        return self.op.get(i, 0)
-
-    def opcode_modes(self, o: int) -> tuple[int,int,int,int]:
-        """parse opcode and modes from input"""
-        mode3 = 0
-        if o > 20000:
-            mode3 = 2
-            o -= 20000
-        elif o > 10000:
-            mode3 = 1
-            o -= 10000
-        mode2 = 0
-        if o > 2000:
-            mode2 = 2
-            o -= 2000
-        elif o > 1000:
-            mode2 = 1
-            o -= 1000
-        mode1 = 0
-        if o > 200:
-            mode1 = 2
-            o -= 200
-        elif o > 100:
-            mode1 = 1
-            o -= 100
-        return o, mode1, mode2, mode3
-
-    def pv(self, idx: int, mode: int) -> int:
-        """determine proper param value based on index and mode"""
-        if mode == 0:
-            return self.opc(self.opc(idx))
-        if mode == 1:
-            return self.opc(idx)
-        return self.opc(self.opc(idx) + self.relative_base)
-
-    def pvi(self, idx: int, mode: int) -> int:
-        """determine proper param value index based on index and mode"""
-        if mode in [0,1]:
-            return self.opc(idx)
-        return self.opc(idx) + self.relative_base
-
 # Data
 data = read_lines("input/day19/input.txt")[0]
 
@@ -3,29 +3,24 @@ from typing import TypeAlias
 from utilities.data import read_lines
 from utilities.runner import runner
 from utilities.search import Search, Searcher, SearchMove
+from utilities.graph import contract, GraphSearcher
 
 @runner("Day 20", "Part 1")
 def solve_part1(lines: list[str]):
     """part 1 solving function"""
-    maze = Maze(lines, False, 0)
-    visited = set()
-    visited.add((0,maze.start))
-    return best_route((0,maze.start), (0,maze.end), visited, maze)
+    return best_route(Maze(lines, False))
 
 @runner("Day 20", "Part 2")
-def solve_part2(lines: list[str], max_recurse: int):
+def solve_part2(lines: list[str]):
     """part 2 solving function"""
-    maze = Maze(lines, True, max_recurse)
-    visited = set()
-    visited.add((0,maze.start))
-    return best_route((0,maze.start), (0,maze.end), visited, maze)
+    return best_route(Maze(lines, True))
 
 Point: TypeAlias = tuple[int,int]
 LevelPoint: TypeAlias = tuple[int,Point]
 
 class Maze:
     """structure representing maze"""
-    def __init__(self, lines: list[str], recursive: bool, max_recurse: int):
+    def __init__(self, lines: list[str], recursive: bool):
         self.spaces = set()
         self.portals = {}
         self.outer_portals = set()
@@ -34,7 +29,6 @@ class Maze:
         self.start = None
         self.end = None
         self.recursive = recursive
-        self.max_recurse = max_recurse
 
         # process grid initially
         labels = set()
@@ -99,21 +93,14 @@ class Maze:
         """compute all the possible routes between different portal labels"""
         if self.routes_cache is not None:
             return self.routes_cache
-        points = list(self.point_labels.keys())
+        graph = contract(self.spaces, set(self.point_labels))
+        search = Search(GraphSearcher(graph, None))
         r = {}
-        for i, a in enumerate(points):
-            a_lbl = self.point_labels[a]
-            for b in points[i:]:
-                b_lbl = self.point_labels[b]
-                if a_lbl == b_lbl:
-                    continue
-                ps = PathSearcher(self, b)
-                search = Search(ps)
-                solution = search.best(SearchMove(0,a))
-                if solution is None:
+        for a, a_lbl in self.point_labels.items():
+            for b, solution in search.sweep(SearchMove(0,a), set(self.point_labels)).items():
+                if self.point_labels[b] == a_lbl:
                     continue
                 add_route(r, a, b, solution.cost)
-                add_route(r, b, a, solution.cost)
         self.routes_cache = r
         return r
 
@@ -146,58 +133,43 @@ def add_route(routes: dict, f: Point, t: Point, steps: int) -> None:
     l.append((t, steps))
     routes[f] = l
 
-class PathSearcher(Searcher):
-    """path search implementation for the area"""
-    def __init__(self, maze: Maze, goal: Point) -> None:
+class RouteSearcher(Searcher):
+    """search implementation over (level, portal point) states, moving along
+    the maze routes and through the portal at the end of each"""
+    def __init__(self, maze: Maze, goal: LevelPoint) -> None:
         self.maze = maze
         self.goal = goal
+        # a shortest route never needs to go deeper than the number of portal
+        # pairs, and capping the levels ends the search of unsolvable mazes
+        self.max_level = len(maze.portals) // 2
 
-    def is_goal(self, obj: Point) -> bool:
-        """determine if the supplied state is the goal location"""
+    def is_goal(self, obj: LevelPoint) -> bool:
+        """determine if the supplied state is the goal"""
         return obj == self.goal
 
-    def possible_moves(self, obj: Point) -> list[SearchMove]:
-        """determine possible moves from curent location"""
+    def possible_moves(self, obj: LevelPoint) -> list[SearchMove]:
+        """determine possible moves from the current level and point"""
+        level, point = obj
+        padjust = 0
+        if point in self.maze.portals:
+            padjust = 1 # cost of using a portal
+            level, point = self.maze.portal_jump(level, point)
+            if level > self.max_level:
+                return []
         moves = []
-        for m in [(1,0),(-1,0),(0,1),(0,-1)]:
-            loc = (obj[0] + m[0], obj[1] + m[1])
-            if loc not in self.maze.spaces:
-                continue
-            moves.append(SearchMove(1,loc))
+        for p, cost in self.maze.moves_from(level, point):
+            moves.append(SearchMove(cost + padjust, (level, p)))
         return moves
 
-    def distance_from_goal(self, obj: Point) -> int:
-        """calculate distance from the goal"""
-        return abs(self.goal[0]-obj[0]) + abs(self.goal[1]-obj[1])
-
-def best_route(lp: LevelPoint, goal: LevelPoint, visited: set[LevelPoint], maze: Maze) -> int:
-    """find the best route between to the goal"""
-    if lp == goal:
-        return 0
-    level, point = lp
-    padjust = 0
-    if point in maze.portals:
-        padjust = 1 # cost of using a portal
-        level, point = maze.portal_jump(level, point)
-    # made this variable since it seems it required tweaking per puzzle
-    # to efficiently complete.  i am sure there is a trick to deal with
-    # this more universally, but just going with it for now.
-    if level > maze.max_recurse:
+def best_route(maze: Maze) -> int:
+    """find the best route from the start to the end of the maze (on the
+    outermost level). dijkstra over the levels and portals reached, done as
+    soon as the end is settled (None if the end cannot be reached)"""
+    search = Search(RouteSearcher(maze, (0, maze.end)))
+    solution = search.best(SearchMove(0, (0, maze.start)))
+    if solution is None:
         return None
-    best = None
-    for p, cost in maze.moves_from(level, point):
-        nlp = (level,p)
-        if nlp in visited:
-            continue
-        cost += padjust
-        nvisited = set(visited)
-        nvisited.add(nlp)
-        ccost = best_route(nlp, goal, nvisited, maze)
-        if ccost is None:
-            continue
-        if best is None or cost + ccost < best:
-            best = cost + ccost
-    return best
+    return solution.cost
 
 # Data
 data = read_lines("input/day20/input.txt")
@@ -301,6 +273,7 @@ assert solve_part1(sample2) == 58
 assert solve_part1(data) == 658
 
 # Part 2
-assert solve_part2(sample, 10) == 26
-assert solve_part2(sample3, 15) == 396
-assert solve_part2(data, 25) == 7612
+assert solve_part2(sample) == 26
+assert solve_part2(sample2) is None
+assert solve_part2(sample3) == 396
+assert solve_part2(data) == 7612
@@ -1,104 +1,140 @@
 """utility imports"""
-from typing import Self
+from collections import deque
 from utilities.data import read_lines, parse_integers
 from utilities.runner import runner
+from utilities.intcode import Computer, ComputerIO
+
+# empty polls answered with -1 before a NIC is blocked regardless, for idle
+# loops the computer cannot park (ones changing memory as they poll)
+IDLE_POLLS = 50
 
 @runner("Day 23", "Part 1")
 def solve_part1(line: str) -> int:
     """part 1 solving function"""
     oc = parse_integers(line, ",")
-    nics = {}
-    computers = []
     nat = NAT()
-    for addr in range(50):
-        nics[addr] = IOProvider(addr, nics, nat)
-        computers.append(Computer(oc, nics[addr]))
-    while True:
-        # run one command at a time per computer until done
-        for computer in computers:
-            if computer.done:
-                continue
-            computer.run_command()
-            if nat.packet is not None:
-                return nat.packet[1]
+    network = Network(oc, 50, nat)
+    while nat.first is None:
+        network.run_next()
+    return nat.first[1]
 
 @runner("Day 23", "Part 2")
 def solve_part2(line: str) -> int:
     """part 2 solving function"""
     oc = parse_integers(line, ",")
-    nics = {}
-    computers = []
     nat = NAT()
-    for addr in range(50):
-        nics[addr] = IOProvider(addr, nics, nat)
-        computers.append(Computer(oc, nics[addr]))
+    network = Network(oc, 50, nat)
     while True:
-        # run one command at a time per computer until done
-        for computer in computers:
-            if computer.done:
-                continue
-            computer.run_command()
-            if nat.idle_state(computers):
-                done, duplicate = nat.resume_network(nics)
-                if done:
-                    return duplicate
+        network.run()
+        done, duplicate = nat.resume_network(network)
+        if done:
+            return duplicate
 
 class NAT:
     """structure for the NAT"""
     def __init__(self):
+        self.first = None
         self.packet = None
         self.last = None
 
-    def idle_state(self, computers: list["Computer"]) -> bool:
-        """determine if all computers are idle"""
-        for computer in computers:
-            if computer.io.idle_requests < 50:
-                return False
-        return True
-
     def receive_packet(self, x: int, y: int):
         """receive a packate"""
+        if self.first is None:
+            self.first = (x, y)
         self.packet = (x, y)
 
-    def resume_network(self, nics: dict[int,"IOProvider"]) -> tuple[bool,int]:
+    def resume_network(self, network: "Network") -> tuple[bool,int]:
         """resume the network"""
         if self.packet is None:
             return False, 0
         if self.last is not None and self.packet[1] == self.last[1]:
             return True, self.packet[1]
         #print(f"resuming network with {self.packet}")
-        nics[0].receive_packet(self.packet[0], self.packet[1])
+        network.deliver(0, self.packet[0], self.packet[1])
         self.last = self.packet
         self.packet = None
         return False, 0
 
-class IOProvider:
+class Network:
+    """event driven scheduler for the NICs. each NIC runs until the
+    computer parks it in its idle polling loop on an empty queue (or its
+    io blocks it after IDLE_POLLS empty polls) and is only woken again when
+    a packet is delivered to it, so the network is idle once every NIC is
+    blocked"""
+    def __init__(self, oc: list[int], size: int, nat: NAT):
+        self.nat = nat
+        self.nics = {}
+        self.computers = {}
+        self.ready = deque()
+        self.blocked = 0
+        for addr in range(size):
+            self.nics[addr] = IOProvider(addr, self)
+            self.computers[addr] = Computer(oc, self.nics[addr])
+            self.computers[addr].park_idle = True
+            self.ready.append(addr)
+
+    def idle(self) -> bool:
+        """determine if all computers are idle"""
+        return self.blocked == len(self.nics)
+
+    def run(self):
+        """run NICs until the network is idle"""
+        while not self.idle():
+            self.run_next()
+
+    def run_next(self):
+        """run the next ready NIC until it is parked or blocked polling for input"""
+        addr = self.ready.popleft()
+        computer = self.computers[addr]
+        computer.run()
+        # halted NICs count as blocked for good as nothing can wake them
+        self.blocked += 1
+        if not computer.done:
+            self.nics[addr].blocked = True
+
+    def deliver(self, addr: int, x: int, y: int):
+        """deliver packet to NIC, waking it when blocked"""
+        if addr == 255:
+            self.nat.receive_packet(x, y)
+            return
+        nic = self.nics.get(addr)
+        if nic is None:
+            return
+        nic.receive_packet(x, y)
+        if nic.blocked:
+            nic.blocked = False
+            self.blocked -= 1
+            self.ready.append(addr)
+
+class IOProvider(ComputerIO):
     """structure for robot"""
-    def __init__(self, address: int, nics: dict[int,Self], nat: NAT):
+    def __init__(self, address: int, network: Network):
         self.address = address
-        self.nics = nics
-        self.queue = []
+        self.network = network
+        self.queue = deque()
         self.queue.append([address])
         self.packet = None
         self.pidx = None
         self.output_queue = []
-        self.idle_requests = 0
-        self.sent_255 = None
-        self.nat = nat
+        self.empty_polls = 0
+        self.blocked = False
 
     def receive_packet(self, x: int, y: int) -> None:
         """receive packet"""
-        self.queue.insert(0, [x,y])
+        self.queue.append([x,y])
 
     def provide_input(self) -> int:
-        """provide input to the program"""
+        """provide input to the program. an empty queue answers -1, until
+        IDLE_POLLS of them in a row block the computer"""
         if self.packet is None and len(self.queue) > 0:
-            self.packet = self.queue.pop()
+            self.packet = self.queue.popleft()
             self.pidx = 0
         if self.packet is None:
-            self.idle_requests += 1
+            if self.empty_polls == IDLE_POLLS:
+                return None
+            self.empty_polls += 1
             return -1
-        self.idle_requests = 0
+        self.empty_polls = 0
         p = self.packet[self.pidx]
         self.pidx += 1
         if self.pidx == len(self.packet):
@@ -107,120 +143,18 @@ class IOProvider:
         #print(f"sending input on NIC {self.address}: {p}")
         return p
 
+    def idle(self) -> bool:
+        """nothing is pending once the queue is drained"""
+        return self.packet is None and len(self.queue) == 0
+
     def accept_output(self, o: int):
         """accept output value and record mapping actions accordingly"""
         self.output_queue.append(o)
         if len(self.output_queue) == 3:
             #print(f"sending output: {self.output_queue}")
-            if self.output_queue[0] == 255:
-                self.nat.receive_packet(self.output_queue[1], self.output_queue[2])
-            elif self.output_queue[0] in self.nics:
-                nic = self.nics[self.output_queue[0]]
-                nic.receive_packet(self.output_queue[1], self.output_queue[2])
+            self.network.deliver(*self.output_queue)
             self.output_queue = []
 
-    def halt_program(self) -> bool:
-        """exit point to stop program"""
-        return False
-
-class Computer:
-    """structure for computer"""
-    def __init__(self, op: list[int], io: IOProvider):
-        self.op = {i:o for i, o in enumerate(op)}
-        self.io = io
-        self.opi = 0
-        self.relative_base = 0
-        self.done = False
-
-    def run(self) -> bool:
-        """run the intcode program and return value"""
-        i = self.opi
-        while i < len(self.op) and not self.done:
-            i = self.run_command()
-
-    def run_command(self) -> int:
-        """run next command for program"""
-        i = self.opi
-        opcode, m1, m2, m3 = self.opcode_modes(self.opc(i))
-        if opcode == 99 or self.io.halt_program():
-            self.done = True
-            return i
-        if opcode == 1:
-            self.op[self.pvi(i+3,m3)] = self.pv(i+1,m1) + self.pv(i+2,m2)
-            i += 4
-        elif opcode == 2:
-            self.op[self.pvi(i+3,m3)] = self.pv(i+1,m1) * self.pv(i+2,m2)
-            i += 4
-        elif opcode == 3:
-            self.op[self.pvi(i+1,m1)] = self.io.provide_input()
-            i += 2
-        elif opcode == 4:
-            self.io.accept_output(self.pv(i+1,m1))
-            i += 2
-        elif opcode == 5:
-            if self.pv(i+1,m1) != 0:
-                i = self.pv(i+2,m2)
-            else:
-                i += 3
-        elif opcode == 6:
-            if self.pv(i+1,m1) == 0:
-                i = self.pv(i+2,m2)
-            else:
-                i += 3
-        elif opcode == 7:
-            self.op[self.pvi(i+3,m3)] = 1 if self.pv(i+1,m1) < self.pv(i+2,m2) else 0
-            i += 4
-        elif opcode == 8:
-            self.op[self.pvi(i+3,m3)] = 1 if self.pv(i+1,m1) == self.pv(i+2,m2) else 0
-            i += 4
-        elif opcode == 9:
-            self.relative_base += self.pv(i+1,m1)
-            i += 2
-        self.opi = i
-
-    def opc(self, i: int) -> int:
-        """get the value of supplied index"""
-        return self.op.get(i, 0)
-
-    def opcode_modes(self, o: int) -> tuple[int,int,int,int]:
-        """parse opcode and modes from input"""
-        mode3 = 0
-        if o > 20000:
-            mode3 = 2
-            o -= 20000
-        elif o > 10000:
-            mode3 = 1
-            o -= 10000
-        mode2 = 0
-        if o > 2000:
-            mode2 = 2
-            o -= 2000
-        elif o > 1000:
-            mode2 = 1
-            o -= 1000
-        mode1 = 0
-        if o > 200:
-            mode1 = 2
-            o -= 200
-        elif o > 100:
-            mode1 = 1
-            o -= 100
-        return o, mode1, mode2, mode3
-
-    def pv(self, idx: int, mode: int) -> int:
-        """determine proper param value based on index and mode"""
-        if mode == 0:
-            return self.opc(self.opc(idx))
-        if mode == 1:
-            return self.opc(idx)
-        return self.opc(self.opc(idx) + self.relative_base)
-
-    def pvi(self, idx: int, mode: int) -> int:
-        """determine proper param value index based on index and mode"""
-        if mode in [0,1]:
-            return self.opc(idx)
-        return self.opc(idx) + self.relative_base
-
 # Data
 data = read_lines("input/day23/input.txt")[0]
 
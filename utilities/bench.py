@@ -0,0 +1,252 @@
+"""Module providing benchmarks of the intcode engines"""
+
+import sys
+import time
+from utilities.data import read_lines, parse_integers
+from utilities.intcode import Computer, CompiledComputer, BatchComputer, ComputerIO, SignalIO
+
+# engine variants benchmarked against each workload
+ENGINES = {
+    "interpreter": Computer,
+    "compiled": CompiledComputer,
+    "batch": BatchComputer,
+}
+
+def read_program(day: int) -> list[int]:
+    """read the puzzle input program of a day"""
+    return parse_integers(read_lines(f"input/day{day:02d}/input.txt")[0], ",")
+
+def day09(engine: type) -> tuple[int,int]:
+    """day 9 part 2: the boost program in sensor boost mode"""
+    io = SignalIO()
+    io.send([2])
+    computer = engine(read_program(9), io)
+    steps = computer.run()
+    return io.receive()[0], steps
+
+def day19(engine: type, size: int = 50) -> tuple[int,int]:
+    """day 19 part 1 over a size by size grid: one drone run per point,
+    each forked from a snapshot taken before the first input (or a single
+    lockstep batch of every point)"""
+    coords = [[x, y] for y in range(size) for x in range(size)]
+    if engine is BatchComputer:
+        batch = BatchComputer(read_program(19), coords)
+        batch.run()
+        return sum(o[0] for o in batch.outputs), None
+    beam = engine(read_program(19), ComputerIO())
+    steps = beam.run()
+    beam = beam.snapshot()
+    points = 0
+    for c in coords:
+        io = SignalIO()
+        io.send(c)
+        steps += beam.fork(io).run()
+        points += io.receive()[0]
+    return points, steps
+
+def day19_large(engine: type) -> tuple[int,int]:
+    """day 19 part 1 over a 100 by 100 grid, the scale of the part 2 search"""
+    return day19(engine, 100)
+
+class Breakout(ComputerIO):
+    """day 13 io: keep the paddle under the ball and track the score"""
+    def __init__(self):
+        self.output = []
+        self.paddle = 0
+        self.ball = 0
+        self.score = 0
+
+    def provide_input(self) -> int:
+        """move the joystick towards the ball"""
+        return (self.ball > self.paddle) - (self.ball < self.paddle)
+
+    def accept_output(self, o: int):
+        """track score, paddle and ball from each output triple"""
+        self.output.append(o)
+        if len(self.output) < 3:
+            return
+        x, y, tile = self.output
+        self.output = []
+        if x == -1 and y == 0:
+            self.score = tile
+        elif tile == 3:
+            self.paddle = x
+        elif tile == 4:
+            self.ball = x
+
+def day13(engine: type) -> tuple[int,int]:
+    """day 13 part 2: play breakout to the end with quarters inserted"""
+    program = read_program(13)
+    program[0] = 2
+    game = Breakout()
+    steps = engine(program, game).run()
+    return game.score, steps
+
+class NetworkIO(SignalIO):
+    """day 23 io: signal queues answering -1 when there is no packet"""
+    def provide_input(self) -> int:
+        """provide next queued input signal (-1 if none)"""
+        if len(self.in_signals) == 0:
+            return -1
+        return self.in_signals.popleft()
+
+def day23(engine: type) -> tuple[int,int]:
+    """day 23 part 2: 50 NICs behind a NAT until it sends the same y to
+    address 0 twice in a row. NICs are parked in their idle polling loop and
+    the network is idle once a round sends nothing"""
+    program = read_program(23)
+    ios = [NetworkIO() for _ in range(50)]
+    computers = []
+    for addr, io in enumerate(ios):
+        io.send([addr])
+        computers.append(engine(program, io))
+        computers[-1].park_idle = True
+    steps = 0
+    nat = None
+    last_y = None
+    while True:
+        sent = False
+        for computer in computers:
+            steps += computer.run()
+            out = computer.io.receive()
+            for i in range(0, len(out), 3):
+                addr, x, y = out[i:i+3]
+                if addr == 255:
+                    nat = (x, y)
+                else:
+                    ios[addr].send([x, y])
+                sent = True
+        if not sent and nat is not None:
+            if nat[1] == last_y:
+                return nat[1], steps
+            ios[0].send(list(nat))
+            last_y = nat[1]
+
+def assemble(source: list) -> list[int]:
+    """assemble a program from words, labels (strings ending in a colon)
+    and label references (other strings, negated with a leading minus)"""
+    labels = {}
+    words = []
+    for w in source:
+        if isinstance(w, str) and w.endswith(":"):
+            labels[w[:-1]] = len(words)
+        else:
+            words.append(w)
+    program = []
+    for w in words:
+        if not isinstance(w, str):
+            program.append(w)
+        elif w.startswith("-"):
+            program.append(-labels[w[1:]])
+        else:
+            program.append(labels[w])
+    return program
+
+# counts primes below the input with a sieve held past the end of the
+# program, addressed by moving the relative base along it
+SIEVE = assemble([
+    3, "n",                          # in [n]
+    1101, 2, 0, "i",                 # i = 2
+    "loop_i:",
+    7, "i", "n", "t",                # t = i < n
+    1006, "t", "end",                # if not t: end
+    109, "sieve", 9, "i",            # rb = sieve + i
+    1205, 0, "composite",            # if [rb]: composite
+    1001, "c", 1, "c",               # c += 1
+    2, "i", "i", "j",                # j = i * i
+    1002, "i", -1, "t", 1, "j", "t", "t", 9, "t", # rb = sieve + j
+    "loop_j:",
+    7, "j", "n", "t",                # t = j < n
+    1006, "t", "done_j",             # if not t: done_j
+    21101, 1, 0, 0,                  # [rb] = 1
+    1, "j", "i", "j", 9, "i",        # j += i, rb += i
+    1105, 1, "loop_j",
+    "done_j:",
+    1002, "j", -1, "t", 9, "t", 109, "-sieve", # rb = 0
+    1105, 1, "next_i",
+    "composite:",
+    1002, "i", -1, "t", 9, "t", 109, "-sieve", # rb = 0
+    "next_i:",
+    1001, "i", 1, "i",               # i += 1
+    1105, 1, "loop_i",
+    "end:",
+    4, "c",                          # out [c]
+    99,
+    "n:", 0, "i:", 0, "j:", 0, "c:", 0, "t:", 0,
+    "sieve:",
+])
+
+def sieve(engine: type, n: int = 20000) -> tuple[int,int]:
+    """synthetic: count the primes below n"""
+    io = SignalIO()
+    io.send([n])
+    steps = engine(SIEVE, io).run()
+    return io.receive()[0], steps
+
+# counts down an inner loop for each count of an outer loop
+LOOPS = assemble([
+    3, "outer", 3, "inner",          # in [outer], in [inner]
+    "loop_outer:",
+    1001, "inner", 0, "count",       # count = inner
+    "loop_inner:",
+    1001, "count", -1, "count",      # count -= 1
+    1005, "count", "loop_inner",     # if count: loop_inner
+    1001, "outer", -1, "outer",      # outer -= 1
+    1005, "outer", "loop_outer",     # if outer: loop_outer
+    4, "outer",                      # out [outer]
+    99,
+    "outer:", 0, "inner:", 0, "count:", 0,
+])
+
+def loops(engine: type, outer: int = 300, inner: int = 1000) -> tuple[int,int]:
+    """synthetic: nested counting loops"""
+    io = SignalIO()
+    io.send([outer, inner])
+    steps = engine(LOOPS, io).run()
+    return io.receive()[0], steps
+
+# workloads benchmarked, with the engines able to run each. day 19 forks a
+# fresh computer per point, which leaves the compiled engine compiling every
+# block from cold for each one (far slower than interpreting)
+WORKLOADS = {
+    "day09": (day09, ("interpreter", "compiled")),
+    "day19": (day19, ("interpreter", "batch")),
+    "day19x100": (day19_large, ("interpreter", "batch")),
+    "day13": (day13, ("interpreter", "compiled")),
+    "day23": (day23, ("interpreter", "compiled")),
+    "sieve": (sieve, ("interpreter", "compiled")),
+    "loops": (loops, ("interpreter", "compiled")),
+}
+
+def measure(workload, engine: type, repeat: int) -> tuple[int,int,float]:
+    """run a workload repeatedly, returning its result, instruction count
+    and best wall time in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result, steps = workload(engine)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return result, steps, best
+
+def benchmark(names: list[str] = None, repeat: int = 3) -> str:
+    """benchmark the named workloads (all by default) on each engine,
+    reporting wall time and instructions per second. engines without an
+    instruction count (batch) are rated on the count of the others"""
+    lines = [f"{'workload':10}{'engine':13}{'result':>12}{'instructions':>14}" +
+             f"{'wall ms':>10}{'Minst/s':>9}"]
+    for name in names or WORKLOADS:
+        workload, engines = WORKLOADS[name]
+        count = None
+        for engine in engines:
+            result, steps, elapsed = measure(workload, ENGINES[engine], repeat)
+            if steps is not None:
+                count = steps
+            rate = f"{count / elapsed / 1e6:9.2f}" if count is not None else f"{'-':>9}"
+            lines.append(f"{name:10}{engine:13}{result:>12}{count or 0:>14}" +
+                         f"{elapsed * 1000:>10.1f}{rate}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    print(benchmark(sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Module providing intcode computer checkpoints saved to disk"""
+
+import zlib
+from utilities.intcode import Computer, ComputerIO, SignalIO
+from utilities.varint import zigzag, unzigzag, encode_varints, decode_varints
+
+# leading bytes identifying a checkpoint (and its format version)
+MAGIC = b"ICK1"
+
+def save(computer: Computer, filename: str):
+    """write a checkpoint of the computer to a file"""
+    with open(filename, "wb") as handle:
+        handle.write(dumps(computer))
+
+def restore(filename: str, io: ComputerIO, kind: type = Computer) -> Computer:
+    """build a computer of the supplied kind from a checkpoint file,
+    attached to the supplied io"""
+    with open(filename, "rb") as handle:
+        return loads(handle.read(), io, kind)
+
+def dumps(computer: Computer) -> bytes:
+    """encode the state of the computer: memory (including the sparse
+    overflow), instruction pointer, relative base and, when attached to a
+    SignalIO, its pending input and output signals. other io plugins keep
+    their own state and are supplied again on restore
+    >>> c = Computer([3, 9, 4, 9, 104, -7, 99], SignalIO())
+    >>> c.io.send([42])
+    >>> c.run_command()
+    >>> loads(dumps(c), SignalIO()).mem
+    [3, 9, 4, 9, 104, -7, 99, 0, 0, 42]
+    """
+    values = [computer.opi, computer.relative_base, 1 if computer.done else 0]
+    values.append(len(computer.mem))
+    values.extend(computer.mem)
+    values.append(len(computer.far))
+    for a, v in computer.far.items():
+        values.extend((a, v))
+    io = computer.io
+    for queue in (io.in_signals, io.out_signals) if isinstance(io, SignalIO) else ((), ()):
+        values.append(len(queue))
+        values.extend(queue)
+    return MAGIC + zlib.compress(encode_varints(map(zigzag, values)))
+
+def loads(data: bytes, io: ComputerIO, kind: type = Computer) -> Computer:
+    """build a computer of the supplied kind from encoded state, attached
+    to the supplied io (see dumps)
+    >>> c = Computer([3, 9, 4, 9, 104, -7, 99], SignalIO())
+    >>> c.io.send([42, 5])
+    >>> c.run_command()
+    >>> r = loads(dumps(c), SignalIO())
+    >>> r.run()
+    2
+    >>> r.opi, r.done, r.io.receive(), list(r.io.in_signals)
+    (6, True, [42, -7], [5])
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not an intcode checkpoint")
+    values = iter(map(unzigzag, decode_varints(zlib.decompress(data[len(MAGIC):]))))
+    opi, relative_base, done = next(values), next(values), next(values)
+    computer = kind([next(values) for _ in range(next(values))], io)
+    computer.opi = opi
+    computer.relative_base = relative_base
+    computer.done = done == 1
+    for _ in range(next(values)):
+        a = next(values)
+        computer.far[a] = next(values)
+    in_signals = [next(values) for _ in range(next(values))]
+    out_signals = [next(values) for _ in range(next(values))]
+    if isinstance(io, SignalIO):
+        io.in_signals.extend(in_signals)
+        io.out_signals.extend(out_signals)
+    return computer
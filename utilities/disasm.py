@@ -0,0 +1,272 @@
+"""Module providing static intcode disassembly and code/data analysis"""
+
+import sys
+from collections import deque
+from utilities.data import read_lines, parse_integers
+
+# mnemonic and parameter count of each opcode
+OPCODES = {
+    1: ("add", 3), 2: ("mul", 3), 3: ("in", 1), 4: ("out", 1), 5: ("jnz", 2),
+    6: ("jz", 2), 7: ("lt", 3), 8: ("eq", 3), 9: ("arb", 1), 99: ("hlt", 0),
+}
+
+# opcodes whose last parameter is written to
+WRITES = {1, 2, 3, 7, 8}
+
+class Instruction:
+    """a decoded instruction"""
+    def __init__(self, addr: int, opcode: int, modes: tuple, params: list[int]):
+        self.addr = addr
+        self.opcode = opcode
+        self.modes = modes
+        self.params = params
+
+    def size(self) -> int:
+        """number of words taken by the instruction"""
+        return len(self.params) + 1
+
+    def next(self) -> int:
+        """address of the following instruction"""
+        return self.addr + self.size()
+
+    def is_jump(self) -> bool:
+        """determine if the instruction is a conditional jump"""
+        return self.opcode in (5, 6)
+
+    def target(self) -> int:
+        """statically known jump target (None when computed at run time)"""
+        if self.modes[1] == 1:
+            return self.params[1]
+        return None
+
+    def taken(self) -> bool:
+        """statically known jump outcome (None when decided at run time)"""
+        if self.modes[0] != 1:
+            return None
+        return (self.params[0] != 0) == (self.opcode == 5)
+
+    def constant(self) -> int:
+        """value stored by an add or multiply of two immediates (else None)"""
+        if self.opcode not in (1, 2) or self.modes[0] != 1 or self.modes[1] != 1:
+            return None
+        a, b = self.params[0], self.params[1]
+        return a + b if self.opcode == 1 else a * b
+
+    def __str__(self) -> str:
+        name = OPCODES[self.opcode][0]
+        args = []
+        for p, m in zip(self.params, self.modes):
+            if m == 0:
+                args.append(f"[{p}]")
+            elif m == 1:
+                args.append(str(p))
+            else:
+                args.append(f"[rb{p:+d}]")
+        return f"{name} {', '.join(args)}".rstrip()
+
+class Block:
+    """straight-line run of instructions entered only at its start"""
+    def __init__(self, start: int):
+        self.start = start
+        self.instructions = []
+        self.successors = []
+        self.indirect = False
+
+    def end(self) -> int:
+        """address following the last instruction of the block"""
+        return self.instructions[-1].next()
+
+    def label(self) -> str:
+        """label of the block"""
+        return f"L{self.start}"
+
+class Analysis:
+    """static analysis of an intcode program: reachable instructions split
+    into basic blocks with their control flow graph, and each address
+    classified as code or data and as read only or written.
+
+    code is found by following control flow from address 0. jumps to
+    computed addresses (typically returns through the stack) are resolved
+    with the calling convention: a constant stored just before a jump that
+    equals the address following the jump is a return address. memory is
+    known to be written through position mode parameters. a write through
+    a relative mode parameter (depending on the run time base) or through
+    a parameter that is itself written may reach any address, so once a
+    program has one no word is known to be read only"""
+    def __init__(self, program: list[int]):
+        self.program = program
+        self.instructions = {}
+        self.entries = {0}
+        self.blocks = {}
+        self.written = set()
+        self.read = set()
+        self.unknown = set()
+        self.explore()
+        self.split_blocks()
+        for inst in self.instructions.values():
+            for idx, (p, m) in enumerate(zip(inst.params, inst.modes)):
+                if m != 0:
+                    continue
+                if inst.opcode in WRITES and idx == len(inst.params) - 1:
+                    self.written.add(p)
+                elif not (inst.is_jump() and idx == 1):
+                    self.read.add(p)
+        for inst in self.instructions.values():
+            if inst.opcode not in WRITES:
+                continue
+            if inst.modes[-1] == 2 or inst.next() - 1 in self.written:
+                self.unknown.add(inst.addr)
+
+    def decode(self, addr: int) -> Instruction:
+        """decode the instruction at an address (None if it is not one)"""
+        if not 0 <= addr < len(self.program):
+            return None
+        o = self.program[addr]
+        opcode = o % 100
+        if o < 0 or opcode not in OPCODES:
+            return None
+        count = OPCODES[opcode][1]
+        modes = (o // 100 % 10, o // 1000 % 10, o // 10000 % 10)[:count]
+        if addr + count >= len(self.program) or any(m > 2 for m in modes):
+            return None
+        if opcode in WRITES and modes[-1] == 1:
+            return None
+        return Instruction(addr, opcode, modes, self.program[addr+1:addr+1+count])
+
+    def explore(self):
+        """find reachable instructions, following control flow from 0 and
+        from return addresses until nothing new is found"""
+        pending = deque([0])
+        while len(pending) > 0:
+            i = pending.popleft()
+            while i not in self.instructions:
+                inst = self.decode(i)
+                if inst is None:
+                    break
+                self.instructions[i] = inst
+                if inst.opcode == 99:
+                    break
+                c = inst.constant()
+                if c is not None and 0 <= c < len(self.program):
+                    prior = self.instructions.get(c - 3)
+                    if prior is not None and prior.is_jump() and c not in self.entries:
+                        self.entries.add(c)
+                        pending.append(c)
+                if inst.is_jump():
+                    taken = inst.taken()
+                    target = inst.target()
+                    if taken is not False and target is not None and target not in self.entries:
+                        self.entries.add(target)
+                        pending.append(target)
+                    if taken is True:
+                        break
+                i = inst.next()
+            if len(pending) == 0:
+                # a call jump found after its return address was stored
+                for inst in list(self.instructions.values()):
+                    c = inst.constant()
+                    if c is None or c in self.entries:
+                        continue
+                    prior = self.instructions.get(c - 3)
+                    if prior is not None and prior.is_jump():
+                        self.entries.add(c)
+                        pending.append(c)
+
+    def split_blocks(self):
+        """split the reachable instructions into basic blocks"""
+        leaders = set(self.entries)
+        for inst in self.instructions.values():
+            if inst.is_jump():
+                leaders.add(inst.next())
+                if inst.target() is not None:
+                    leaders.add(inst.target())
+        block = None
+        for addr in sorted(self.instructions):
+            inst = self.instructions[addr]
+            if block is None or addr in leaders or block.end() != addr:
+                block = Block(addr)
+                self.blocks[addr] = block
+            block.instructions.append(inst)
+            if inst.is_jump() or inst.opcode == 99:
+                block = None
+        for block in self.blocks.values():
+            last = block.instructions[-1]
+            if last.opcode == 99:
+                continue
+            taken = last.taken() if last.is_jump() else False
+            if taken is not False:
+                if last.target() is None:
+                    block.indirect = True
+                elif last.target() in self.blocks:
+                    block.successors.append(last.target())
+            if taken is not True and last.next() in self.blocks:
+                block.successors.append(last.next())
+
+    def code(self) -> set[int]:
+        """addresses holding reachable instructions (opcode and params)"""
+        return {a for inst in self.instructions.values() for a in range(inst.addr, inst.next())}
+
+    def kind(self, addr: int) -> str:
+        """classify an address as code or data"""
+        inst = self.instructions
+        for a in range(addr, max(addr - 4, -1), -1):
+            if a in inst and addr < inst[a].next():
+                return "code"
+        return "data"
+
+    def read_only(self, addr: int) -> bool:
+        """determine if an address is never written"""
+        return addr not in self.written and len(self.unknown) == 0
+
+    def patched(self) -> set[int]:
+        """code addresses that may be written to (self-modifying code), which
+        are unsafe to pre-decode or compile. every code address may be when
+        the program writes to unknown addresses"""
+        if len(self.unknown) > 0:
+            return self.code()
+        return self.code() & self.written
+
+    def loops(self) -> list[int]:
+        """blocks targeted by a backward edge: loop headers, where the hot
+        regions of the program are"""
+        return sorted({s for b in self.blocks.values() for s in b.successors if s <= b.start})
+
+    def listing(self) -> str:
+        """labelled disassembly of the basic blocks with their successors"""
+        lines = []
+        loops = set(self.loops())
+        for start in sorted(self.blocks):
+            block = self.blocks[start]
+            header = f"{block.label()}:"
+            if start in loops:
+                header += "  ; loop"
+            lines.append(header)
+            for inst in block.instructions:
+                lines.append(f"  {inst.addr:5d}  {inst}")
+            succ = [self.blocks[s].label() for s in block.successors]
+            if block.indirect:
+                succ.append("*")
+            if len(succ) > 0:
+                lines.append(f"         -> {', '.join(succ)}")
+        code = self.code()
+        data = len(self.program) - len(code)
+        lines.append(f"; {len(self.blocks)} blocks, {len(code)} code words, {data} data words, " +
+                     f"{len(self.written)} written, {len(self.unknown)} unknown writes, " +
+                     f"{len(self.patched())} patched")
+        return "\n".join(lines)
+
+def analyze(program: list[int]) -> Analysis:
+    """statically analyze an intcode program
+    >>> a = analyze([1101, 1, 2, 9, 1005, 9, 0, 99, 0, 0])
+    >>> sorted(a.blocks), a.blocks[0].successors, a.loops()
+    ([0, 7], [0, 7], [0])
+    >>> a.kind(5), a.kind(9), a.read_only(9), a.read_only(8), sorted(a.written)
+    ('code', 'data', False, True, [9])
+    >>> a = analyze([1101, 0, 5, 7, 1101, 1, 2, 0, 99])
+    >>> sorted(a.unknown), a.read_only(8), len(a.patched()) == len(a.code())
+    ([4], False, True)
+    """
+    return Analysis(program)
+
+if __name__ == "__main__":
+    print(analyze(parse_integers(read_lines(sys.argv[1])[0], ",")).listing())
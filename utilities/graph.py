@@ -0,0 +1,52 @@
+"""Module providing corridor contracted graphs of grid mazes"""
+
+from utilities.search import Searcher, SearchMove
+
+# steps to the four neighbours of a grid cell
+STEPS = [(1,0),(-1,0),(0,1),(0,-1)]
+
+def contract(spaces: set[tuple[int,int]], points: set[tuple[int,int]]) \
+    -> dict[tuple[int,int],list[tuple[tuple[int,int],int]]]:
+    """build a weighted graph of the open cells of a grid maze. nodes are
+    the supplied points of interest along with every junction and dead end,
+    and each corridor between two nodes collapses into a single edge
+    weighted with its length in steps
+    >>> spaces = {(0,0), (1,0), (2,0), (3,0), (2,1), (2,2)}
+    >>> g = contract(spaces, {(0,0)})
+    >>> sorted(g), sorted(g[(2,0)])
+    ([(0, 0), (2, 0), (2, 2), (3, 0)], [((0, 0), 2), ((2, 2), 2), ((3, 0), 1)])
+    """
+    nodes = set(points)
+    for cell in spaces:
+        if len(neighbours(spaces, cell)) != 2:
+            nodes.add(cell)
+    graph = {}
+    for node in nodes:
+        edges = {}
+        for n in neighbours(spaces, node):
+            prev, cur, steps = node, n, 1
+            while cur not in nodes:
+                prev, cur = cur, [c for c in neighbours(spaces, cur) if c != prev][0]
+                steps += 1
+            if cur != node and steps < edges.get(cur, steps + 1):
+                edges[cur] = steps
+        graph[node] = list(edges.items())
+    return graph
+
+def neighbours(spaces: set[tuple[int,int]], cell: tuple[int,int]) -> list[tuple[int,int]]:
+    """open cells next to the supplied cell"""
+    return [n for n in ((cell[0]+s[0], cell[1]+s[1]) for s in STEPS) if n in spaces]
+
+class GraphSearcher(Searcher):
+    """search implementation over a contracted graph"""
+    def __init__(self, graph: dict, goal) -> None:
+        self.graph = graph
+        self.goal = goal
+
+    def is_goal(self, obj) -> bool:
+        """determine if the supplied state is the goal node"""
+        return obj == self.goal
+
+    def possible_moves(self, obj) -> list[SearchMove]:
+        """moves along each edge of the node"""
+        return [SearchMove(steps, n) for n, steps in self.graph.get(obj, [])]
@@ -0,0 +1,854 @@
+"""Module providing shared intcode computer implementation"""
+
+import math
+import time
+from collections import deque
+from typing import Self
+
+# writes landing this far past the end of contiguous memory are kept in the
+# sparse overflow instead of growing the memory list out to the address.
+GROW_LIMIT = 4096
+
+# instructions executed between deadline checks of a timed run
+DEADLINE_CHECK = 10000
+
+# longest run of instructions compiled into a single block
+MAX_BLOCK = 64
+
+# events a computer can be run until
+OUTPUT = "output"
+INPUT = "input"
+HALT = "halt"
+
+# names of the computer methods that execute each opcode
+HANDLERS = {
+    1: "add", 2: "multiply", 3: "input", 4: "output", 5: "jump_if_true",
+    6: "jump_if_false", 7: "less_than", 8: "equals", 9: "adjust_base", 99: "halt",
+}
+
+class HaltProgram(Exception):
+    """raised by an io plugin (typically from accept_output) to stop the
+    program; the computer catches it and marks itself done"""
+
+class ComputerIO:
+    """base io plugin implementation"""
+    # pylint: disable=unused-argument
+    def provide_input(self) -> int:
+        """provide an input value to the program. returning None pauses
+        the computer at the input instruction until run again"""
+        return None
+
+    def accept_output(self, o: int):
+        """accept output value produced by the program. raise HaltProgram
+        to stop the program"""
+
+    def idle(self) -> bool:
+        """report that nothing is pending for the program, so an input it
+        keeps polling for would only answer the same again. computers with
+        park_idle set only park an idle polling loop when this is True"""
+        return False
+
+class SignalIO(ComputerIO):
+    """io plugin that reads and writes signal queues"""
+    def __init__(self):
+        self.in_signals = deque()
+        self.out_signals = deque()
+
+    def provide_input(self) -> int:
+        """provide next queued input signal (if any)"""
+        if len(self.in_signals) == 0:
+            return None
+        return self.in_signals.popleft()
+
+    def accept_output(self, o: int):
+        """record output signal"""
+        self.out_signals.append(o)
+
+    def send(self, values: list[int]):
+        """queue a batch of input signals"""
+        self.in_signals.extend(values)
+
+    def send_line(self, line: str):
+        """queue a line of ascii input terminated by a newline"""
+        self.in_signals.extend(map(ord, line))
+        self.in_signals.append(10)
+
+    def idle(self) -> bool:
+        """nothing is pending once the input signals are drained"""
+        return len(self.in_signals) == 0
+
+    def receive(self) -> list[int]:
+        """drain all output signals produced so far"""
+        out = list(self.out_signals)
+        self.out_signals.clear()
+        return out
+
+    def receive_text(self) -> str:
+        """drain all output signals produced so far as ascii text"""
+        return "".join(chr(o) for o in self.receive() if o < 256)
+
+class Computer:
+    """structure for intcode computer"""
+    def __init__(self, op: list[int], io: ComputerIO):
+        self.mem = list(op)
+        self.far = {}
+        self.io = io
+        self.opi = 0
+        self.relative_base = 0
+        self.done = False
+        self.decoded = {}
+        self.stop_on_output = False
+        self.event = None
+        # park in idle polling loops (see idle_poll)
+        self.park_idle = False
+        self.polled = None
+        self.changes = 0
+
+    def snapshot(self) -> Self:
+        """capture the current state of the computer as a detached copy
+        that can be forked any number of times. every word that looks like
+        an instruction is decoded up front so forks start with a warm cache
+        (entries for data words are dropped as soon as they are written)"""
+        snapshot = self.fork(None)
+        for i, o in enumerate(snapshot.mem):
+            if i not in snapshot.decoded and o % 100 in HANDLERS:
+                snapshot.decode(i)
+        return snapshot
+
+    def fork(self, io: ComputerIO) -> Self:
+        """clone the computer in its current state attached to the supplied
+        io. memory and decoded instructions are copied to the clone"""
+        # attributes are assigned in __init__ order so the clone keeps the
+        # same (faster) shared instance layout as a freshly built computer
+        clone = type(self).__new__(type(self))
+        clone.mem = self.mem[:]
+        clone.far = dict(self.far)
+        clone.io = io
+        clone.opi = self.opi
+        clone.relative_base = self.relative_base
+        clone.done = self.done
+        clone.decoded = dict(self.decoded)
+        clone.stop_on_output = False
+        clone.event = None
+        clone.park_idle = self.park_idle
+        clone.polled = None
+        clone.changes = 0
+        return clone
+
+    def run(self, max_steps: int = None, deadline: float = None) -> int:
+        """run the intcode program until it halts or is waiting on input.
+        max_steps caps the number of instructions executed and deadline (a
+        time.monotonic() value) the time taken. returns the number of
+        instructions executed"""
+        if deadline is None:
+            return self.execute(max_steps)
+        steps = 0
+        while not self.done and time.monotonic() < deadline:
+            chunk = DEADLINE_CHECK
+            if max_steps is not None:
+                chunk = min(chunk, max_steps - steps)
+                if chunk == 0:
+                    break
+            executed = self.execute(chunk)
+            steps += executed
+            if executed < chunk:
+                break
+        return steps
+
+    def run_until(self, event: str) -> str:
+        """run the intcode program until the supplied event (OUTPUT or INPUT)
+        occurs. returns the event that stopped the program, which is HALT
+        once it is done"""
+        self.stop_on_output = event == OUTPUT
+        self.execute(None)
+        self.stop_on_output = False
+        stopped = self.event
+        self.event = None
+        if stopped is not None:
+            return stopped
+        return HALT if self.done else INPUT
+
+    def run_command(self):
+        """run next command for program"""
+        self.execute(1)
+
+    def execute(self, limit: int) -> int:
+        """execute instructions until halted, waiting on input or the
+        supplied instruction limit is reached (None for no limit). returns
+        the number of instructions executed"""
+        mem = self.mem
+        decoded = self.decoded
+        i = self.opi
+        steps = 0
+        try:
+            while i < len(mem) and steps != limit:
+                d = decoded.get(i)
+                if d is None:
+                    d = self.decode(i)
+                opcode, modes, handler = d
+                if opcode == 99:
+                    self.done = True
+                    break
+                ni = handler(self, i, modes)
+                if ni is None:
+                    break
+                i = ni
+                steps += 1
+                if self.event is not None:
+                    break
+        except HaltProgram:
+            self.done = True
+        self.opi = i
+        return steps
+
+    def decode(self, i: int) -> tuple:
+        """decode the instruction at the supplied address into its opcode,
+        parameter modes and handler, caching the result for reuse"""
+        o = self.mem[i]
+        opcode = o % 100
+        if opcode not in HANDLERS:
+            raise ValueError(f"invalid opcode {o} at address {i}")
+        modes = (o // 100 % 10, o // 1000 % 10, o // 10000 % 10)
+        d = (opcode, modes, getattr(type(self), HANDLERS[opcode]))
+        self.decoded[i] = d
+        return d
+
+    def add(self, i: int, modes: tuple) -> int:
+        """opcode 1: add first two params into third"""
+        m1, m2, m3 = modes
+        self.write(self.param_addr(i+3, m3), self.param(i+1, m1) + self.param(i+2, m2))
+        return i + 4
+
+    def multiply(self, i: int, modes: tuple) -> int:
+        """opcode 2: multiply first two params into third"""
+        m1, m2, m3 = modes
+        self.write(self.param_addr(i+3, m3), self.param(i+1, m1) * self.param(i+2, m2))
+        return i + 4
+
+    def input(self, i: int, modes: tuple) -> int:
+        """opcode 3: store input value into param (None when no input is available)"""
+        v = self.io.provide_input()
+        if v is None or (self.park_idle and self.idle_poll(i, v, self.relative_base)):
+            return None
+        self.write(self.param_addr(i+1, modes[0]), v)
+        return i + 2
+
+    def idle_poll(self, i: int, v: int, rb: int) -> bool:
+        """check an input for an idle polling loop: the same value read at
+        the same address and relative base as the previous input, with no
+        output and no memory changed since. storing the value would only
+        bring the program back to this same state, so while the io has
+        nothing else pending the computer is parked at the input instead
+        (as if no input were available)"""
+        state = (i, v, rb, self.changes)
+        if state == self.polled and self.io.idle():
+            return True
+        self.polled = state
+        return False
+
+    def output(self, i: int, modes: tuple) -> int:
+        """opcode 4: output param value"""
+        self.polled = None
+        self.io.accept_output(self.param(i+1, modes[0]))
+        if self.stop_on_output:
+            self.event = OUTPUT
+        return i + 2
+
+    def jump_if_true(self, i: int, modes: tuple) -> int:
+        """opcode 5: jump to second param when first is non-zero"""
+        if self.param(i+1, modes[0]) != 0:
+            return self.param(i+2, modes[1])
+        return i + 3
+
+    def jump_if_false(self, i: int, modes: tuple) -> int:
+        """opcode 6: jump to second param when first is zero"""
+        if self.param(i+1, modes[0]) == 0:
+            return self.param(i+2, modes[1])
+        return i + 3
+
+    def less_than(self, i: int, modes: tuple) -> int:
+        """opcode 7: store 1 in third param when first is less than second"""
+        m1, m2, m3 = modes
+        lt = self.param(i+1, m1) < self.param(i+2, m2)
+        self.write(self.param_addr(i+3, m3), 1 if lt else 0)
+        return i + 4
+
+    def equals(self, i: int, modes: tuple) -> int:
+        """opcode 8: store 1 in third param when first equals second"""
+        m1, m2, m3 = modes
+        eq = self.param(i+1, m1) == self.param(i+2, m2)
+        self.write(self.param_addr(i+3, m3), 1 if eq else 0)
+        return i + 4
+
+    def adjust_base(self, i: int, modes: tuple) -> int:
+        """opcode 9: adjust the relative base by param"""
+        self.relative_base += self.param(i+1, modes[0])
+        return i + 2
+
+    def halt(self, i: int, modes: tuple) -> int:
+        """opcode 99: halt program"""
+        # pylint: disable=unused-argument
+        return i
+
+    def read(self, a: int) -> int:
+        """get the value at the supplied address"""
+        if 0 <= a < len(self.mem):
+            return self.mem[a]
+        return self.far.get(a, 0)
+
+    def write(self, a: int, v: int):
+        """set the value at the supplied address"""
+        mem = self.mem
+        if a in self.decoded:
+            # self-modifying write: drop the stale decoded instruction
+            del self.decoded[a]
+        if 0 <= a < len(mem):
+            if mem[a] != v:
+                self.changes += 1
+            mem[a] = v
+        elif 0 <= a < len(mem) + GROW_LIMIT:
+            self.grow(a + 1)
+            if mem[a] != v:
+                self.changes += 1
+            mem[a] = v
+        else:
+            if self.far.get(a, 0) != v:
+                self.changes += 1
+            self.far[a] = v
+
+    def grow(self, size: int):
+        """grow contiguous memory to the supplied size, absorbing any
+        values held in the sparse overflow for the new range"""
+        mem = self.mem
+        start = len(mem)
+        if size <= start:
+            return
+        mem.extend([0] * (size - start))
+        if len(self.far) > 0:
+            for a in [a for a in self.far if start <= a < size]:
+                mem[a] = self.far.pop(a)
+
+    def param(self, idx: int, mode: int) -> int:
+        """determine proper param value based on index and mode"""
+        mem = self.mem
+        a = idx if mode == 1 else self.param_addr(idx, mode)
+        if 0 <= a < len(mem):
+            return mem[a]
+        return self.far.get(a, 0)
+
+    def param_addr(self, idx: int, mode: int) -> int:
+        """determine proper param value index based on index and mode"""
+        mem = self.mem
+        a = mem[idx] if idx < len(mem) else self.far.get(idx, 0)
+        if mode == 2:
+            return a + self.relative_base
+        return a
+
+class CompiledComputer(Computer):
+    """intcode computer that translates straight-line runs of instructions
+    into python functions, compiled once and cached by entry address.
+    blocks that are written to fall back to the interpreter. a block
+    closed by a branch back to its own entry (a tight counting loop) loops
+    within its function rather than returning to dispatch each pass"""
+    def __init__(self, op: list[int], io: ComputerIO):
+        super().__init__(op, io)
+        self.blocks = {}
+        self.code = {}
+        # park_idle setting the blocks were compiled with, as they only
+        # count memory changes when built with it set
+        self.compiled_idle = False
+
+    def execute(self, limit: int) -> int:
+        """execute compiled blocks until halted, waiting on input or the
+        instruction limit is reached. the interpreter takes over once fewer
+        instructions than a full block remain within the limit. looping
+        blocks are given the rest of the limit as their budget"""
+        if self.compiled_idle != self.park_idle:
+            self.blocks = {}
+            self.code = {}
+            self.compiled_idle = self.park_idle
+        mem = self.mem
+        io = self.io
+        blocks = self.blocks
+        steps = 0
+        while self.opi < len(mem) and not self.done:
+            if limit is not None and limit - steps < MAX_BLOCK:
+                steps += super().execute(limit - steps)
+                break
+            i = self.opi
+            if i in blocks:
+                block = blocks[i]
+            else:
+                block = self.compile_block(i)
+            if block is None:
+                executed = super().execute(1)
+                if executed == 0 or self.event is not None:
+                    steps += executed
+                    break
+                steps += executed
+                continue
+            budget = math.inf if limit is None else limit - steps
+            self.opi, executed, paused = block(self, mem, io, self.code, self.decoded, budget)
+            steps += executed
+            if paused:
+                break
+        return steps
+
+    def fork(self, io: ComputerIO) -> Self:
+        """clone the computer in its current state attached to the supplied
+        io. compiled blocks are shared with the clone"""
+        clone = super().fork(io)
+        clone.blocks = dict(self.blocks)
+        clone.code = dict(self.code)
+        clone.compiled_idle = self.compiled_idle
+        return clone
+
+    def write(self, a: int, v: int):
+        """set the value at the supplied address, dropping compiled blocks
+        that cover it"""
+        super().write(a, v)
+        if a in self.code:
+            self.invalidate(a)
+
+    def invalidate(self, a: int):
+        """a compiled block has been written to: drop any block covering the
+        address so its entry runs through the interpreter from now on"""
+        for entry in self.code.pop(a, ()):
+            self.blocks[entry] = None
+        self.decoded.pop(a, None)
+
+    def compile_block(self, entry: int):
+        """translate the straight-line instructions starting at the entry
+        address into a python function (None when nothing can be compiled)"""
+        mem = self.mem
+        lines = []
+        i = entry
+        count = 0
+        closed = False
+        # param (mode and word) a compare just stored its flag c to
+        compared = None
+        looped = False
+        while i < len(mem) and count < MAX_BLOCK:
+            o = mem[i]
+            opcode = o % 100
+            if opcode not in HANDLERS or opcode == 99:
+                break
+            modes = (o // 100 % 10, o // 1000 % 10, o // 10000 % 10)
+            size = 4 if opcode in (1, 2, 7, 8) else 3 if opcode in (5, 6) else 2
+            if i + size > len(mem):
+                break
+            params = mem[i+1:i+size]
+            count += 1
+            nxt = i + size
+            args = [self.compiled_read(p, m) for p, m in zip(params, modes)]
+            if opcode == 1:
+                lines.extend(self.compiled_write(params[2], modes[2], \
+                    f"{args[0]} + {args[1]}", nxt, count))
+            elif opcode == 2:
+                lines.extend(self.compiled_write(params[2], modes[2], \
+                    f"{args[0]} * {args[1]}", nxt, count))
+            elif opcode == 3:
+                lines.extend(compiled_io("v = io.provide_input()", i, count))
+                lines.append(f"if v is None or (m.park_idle and m.idle_poll({i}, v, rb)):")
+                lines.append(f"    {compiled_exit(i, count - 1, True)}")
+                lines.extend(self.compiled_write(params[0], modes[0], "v", nxt, count))
+            elif opcode == 4:
+                lines.append("m.polled = None")
+                lines.extend(compiled_io(f"io.accept_output({args[0]})", i, count))
+                lines.append("if m.stop_on_output:")
+                lines.append(f"    m.event = {OUTPUT!r}")
+                lines.append(f"    {compiled_exit(nxt, count, True)}")
+            elif opcode in (5, 6):
+                if compared == (modes[0], params[0]):
+                    # fused compare and branch: test the flag kept from the
+                    # compare instead of reading it back from memory
+                    lines.append("if c:" if opcode == 5 else "if not c:")
+                else:
+                    test = "!=" if opcode == 5 else "=="
+                    lines.append(f"if {args[0]} {test} 0:")
+                if modes[1] == 1 and params[1] == entry:
+                    # branch back to the entry: run the next pass in place
+                    # while it fits in the budget
+                    looped = True
+                    lines.append(f"    n += {count}")
+                    lines.append(f"    if n + {count} <= budget:")
+                    lines.append("        continue")
+                    lines.append(f"    {compiled_exit(entry, 0, False)}")
+                else:
+                    lines.append(f"    {compiled_exit(args[1], count, False)}")
+                lines.append(compiled_exit(nxt, count, False))
+                i = nxt
+                closed = True
+                break
+            elif opcode in (7, 8):
+                test = "<" if opcode == 7 else "=="
+                lines.append(f"c = {args[0]} {test} {args[1]}")
+                lines.extend(self.compiled_write(params[2], modes[2], \
+                    "1 if c else 0", nxt, count))
+                compared = (modes[2], params[2])
+                i = nxt
+                continue
+            elif opcode == 9:
+                lines.append(f"rb += {args[0]}")
+            compared = None
+            i = nxt
+        if count == 0:
+            self.blocks[entry] = None
+            return None
+        if not closed:
+            lines.append(compiled_exit(i, count, False))
+        if looped:
+            lines = ["while True:"] + [f"    {l}" for l in lines]
+        source = "def block(m, mem, io, code, decoded, budget):\n" + \
+            "    rd = m.read\n    rb = m.relative_base\n    n = 0\n" + \
+            "".join(f"    {l}\n" for l in lines)
+        scope = {"HaltProgram": HaltProgram}
+        exec(compile(source, f"<intcode block {entry}>", "exec"), scope) # pylint: disable=exec-used
+        block = scope["block"]
+        self.blocks[entry] = block
+        for a in range(entry, i):
+            self.code[a] = self.code.get(a, ()) + (entry,)
+        return block
+
+    def compiled_read(self, p: int, mode: int) -> str:
+        """python expression reading a param with the supplied mode"""
+        if mode == 1:
+            return str(p)
+        if mode == 0:
+            return f"mem[{p}]" if 0 <= p < len(self.mem) else f"rd({p})"
+        return f"(mem[t] if 0 <= (t := rb + {p}) < len(mem) else rd(t))"
+
+    def compiled_write(self, p: int, mode: int, value: str, nxt: int, count: int) -> list[str]:
+        """python statements storing value to a param with the supplied mode.
+        a write to compiled code exits the block once the value is stored"""
+        if mode == 2:
+            lines = [f"a = rb + {p}", f"w = {value}"]
+        else:
+            lines = [f"a = {p}", f"w = {value}"]
+        lines.append("if 0 <= a < len(mem):")
+        if self.park_idle:
+            # changed memory breaks an idle polling loop (see idle_poll)
+            lines.append("    if mem[a] != w:")
+            lines.append("        m.changes += 1")
+        lines.append("    mem[a] = w")
+        lines.append("else:")
+        lines.append("    m.write(a, w)")
+        lines.append("if a in code or a in decoded:")
+        lines.append("    m.invalidate(a)")
+        lines.append(f"    {compiled_exit(nxt, count, False)}")
+        return lines
+
+def compiled_io(call: str, i: int, count: int) -> list[str]:
+    """python statements making an io call for the instruction at i. when
+    the io raises HaltProgram the computer is marked done and the block
+    exits at the instruction (as the interpreter does), keeping the steps
+    already executed and the relative base"""
+    return [
+        "try:",
+        f"    {call}",
+        "except HaltProgram:",
+        "    m.done = True",
+        f"    {compiled_exit(i, count - 1, True)}",
+    ]
+
+def compiled_exit(nxt, count: int, paused: bool) -> str:
+    """python statement leaving a compiled block, count instructions into
+    its current pass"""
+    return f"m.relative_base = rb; return ({nxt}, n + {count}, {paused})"
+
+class BatchComputer:
+    """runs one intcode program over many lanes of input in lockstep. memory
+    is held as a column of lane values per address so that lanes sitting at
+    the same instruction share its decode and dispatch, with lanes regrouped
+    by instruction pointer whenever a jump sends them different ways"""
+    def __init__(self, op: list[int], inputs: list[list[int]]):
+        self.lanes = len(inputs)
+        self.mem = [[o] * self.lanes for o in op]
+        self.far = {}
+        self.varied = set()
+        self.relative_base = [0] * self.lanes
+        self.inputs = [deque(i) for i in inputs]
+        self.outputs = [[] for _ in inputs]
+        self.done = [False] * self.lanes
+        self.groups = {0: list(range(self.lanes))}
+        self.waiting = {}
+
+    def poke(self, a: int, values: list[int]):
+        """set a different value at the supplied address for each lane"""
+        self.column(a)[:] = values
+        self.varied.add(a)
+
+    def peek(self, a: int) -> list[int]:
+        """get the value at the supplied address for each lane"""
+        return list(self.column(a))
+
+    def send(self, lane: int, values: list[int]):
+        """queue input for a lane, waking it if it is waiting on input"""
+        self.inputs[lane].extend(values)
+        for ip, lanes in self.waiting.items():
+            if lane in lanes:
+                lanes.remove(lane)
+                self.advance(ip, [lane])
+                break
+
+    def run(self):
+        """step every group of lanes until all lanes halt or wait on input"""
+        while self.groups:
+            current = self.groups
+            self.groups = {}
+            for ip, lanes in current.items():
+                self.step(ip, lanes)
+
+    def advance(self, ip: int, lanes: list[int]):
+        """move lanes to the supplied instruction pointer"""
+        group = self.groups.get(ip)
+        if group is None:
+            self.groups[ip] = lanes
+        else:
+            group.extend(lanes)
+
+    def column(self, a: int) -> list[int]:
+        """get the lane values at the supplied address"""
+        mem = self.mem
+        if 0 <= a < len(mem):
+            return mem[a]
+        if 0 <= a < len(mem) + GROW_LIMIT:
+            while len(mem) <= a:
+                mem.append([0] * self.lanes)
+            if self.far:
+                for fa in [fa for fa in self.far if fa < len(mem)]:
+                    mem[fa] = self.far.pop(fa)
+            return mem[a]
+        if a not in self.far:
+            self.far[a] = [0] * self.lanes
+        return self.far[a]
+
+    def step(self, ip: int, lanes: list[int]):
+        """execute the instruction at ip for the group of lanes"""
+        if ip >= len(self.mem):
+            return
+        ops = self.mem[ip]
+        if ip not in self.varied:
+            self.execute(ip, ops[lanes[0]], lanes)
+            return
+        # instruction word has been written: lanes may disagree on it
+        by_word = {}
+        for k in lanes:
+            by_word.setdefault(ops[k], []).append(k)
+        for o, group in by_word.items():
+            self.execute(ip, o, group)
+
+    def execute(self, ip: int, o: int, lanes: list[int]):
+        """execute decoded instruction for lanes that share it"""
+        opcode = o % 100
+        m1, m2, m3 = o // 100 % 10, o // 1000 % 10, o // 10000 % 10
+        if opcode == 99:
+            for k in lanes:
+                self.done[k] = True
+        elif opcode in (1, 2, 7, 8):
+            a = self.values(ip+1, m1, lanes)
+            b = self.values(ip+2, m2, lanes)
+            if opcode == 1:
+                results = [x + y for x, y in zip(a, b)]
+            elif opcode == 2:
+                results = [x * y for x, y in zip(a, b)]
+            elif opcode == 7:
+                results = [1 if x < y else 0 for x, y in zip(a, b)]
+            else:
+                results = [1 if x == y else 0 for x, y in zip(a, b)]
+            self.store(ip+3, m3, lanes, results)
+            self.advance(ip+4, lanes)
+        elif opcode == 3:
+            ready = [k for k in lanes if self.inputs[k]]
+            if len(ready) != len(lanes):
+                waiting = self.waiting.setdefault(ip, [])
+                waiting.extend(k for k in lanes if not self.inputs[k])
+            if ready:
+                self.store(ip+1, m1, ready, [self.inputs[k].popleft() for k in ready])
+                self.advance(ip+2, ready)
+        elif opcode == 4:
+            for k, v in zip(lanes, self.values(ip+1, m1, lanes)):
+                self.outputs[k].append(v)
+            self.advance(ip+2, lanes)
+        elif opcode in (5, 6):
+            tests = self.values(ip+1, m1, lanes)
+            targets = self.values(ip+2, m2, lanes)
+            jump = opcode == 5
+            fall = []
+            for k, t, target in zip(lanes, tests, targets):
+                if (t != 0) == jump:
+                    self.advance(target, [k])
+                else:
+                    fall.append(k)
+            if fall:
+                self.advance(ip+3, fall)
+        elif opcode == 9:
+            rb = self.relative_base
+            for k, v in zip(lanes, self.values(ip+1, m1, lanes)):
+                rb[k] += v
+            self.advance(ip+2, lanes)
+        else:
+            raise ValueError(f"invalid opcode {o} at address {ip}")
+
+    def values(self, idx: int, mode: int, lanes: list[int]) -> list[int]:
+        """determine param value for each lane based on index and mode"""
+        p = self.column(idx)
+        if mode == 1:
+            return [p[k] for k in lanes]
+        if mode == 0 and idx not in self.varied:
+            col = self.column(p[lanes[0]])
+            return [col[k] for k in lanes]
+        column = self.column
+        if mode == 0:
+            return [column(p[k])[k] for k in lanes]
+        rb = self.relative_base
+        return [column(rb[k] + p[k])[k] for k in lanes]
+
+    def store(self, idx: int, mode: int, lanes: list[int], values: list[int]):
+        """store value for each lane at the param address for index and mode"""
+        p = self.column(idx)
+        if mode != 2 and idx not in self.varied:
+            a = p[lanes[0]]
+            col = self.column(a)
+            for k, v in zip(lanes, values):
+                col[k] = v
+            self.varied.add(a)
+            return
+        rb = self.relative_base
+        for k, v in zip(lanes, values):
+            a = p[k] + rb[k] if mode == 2 else p[k]
+            self.column(a)[k] = v
+            self.varied.add(a)
+
+class Profile:
+    """execution profile gathered by a profiled computer"""
+    def __init__(self):
+        self.opcodes = {}
+        self.addresses = {}
+        self.instructions = 0
+        self.elapsed = 0.0
+        self.io_time = 0.0
+        self.io_calls = {}
+
+    def instructions_per_second(self) -> float:
+        """interpreter throughput over the profiled runs"""
+        if self.elapsed == 0:
+            return 0.0
+        return self.instructions / self.elapsed
+
+    def vm_time(self) -> float:
+        """seconds spent in the interpreter outside of io callbacks"""
+        return self.elapsed - self.io_time
+
+    def hot_addresses(self, count: int) -> list[tuple[int,int]]:
+        """most executed instruction addresses with their hit counts"""
+        hits = sorted(self.addresses.items(), key=lambda a: a[1], reverse=True)
+        return hits[:count]
+
+    def report(self, count: int = 10) -> str:
+        """summarize the profile as text"""
+        lines = [
+            f"instructions: {self.instructions} " + \
+                f"({self.instructions_per_second():0.0f}/sec)",
+            f"time: {self.elapsed*1000:0.2f} ms (vm {self.vm_time()*1000:0.2f} ms, " + \
+                f"io {self.io_time*1000:0.2f} ms)",
+            "io calls: " + ", ".join(f"{n}={c}" for n, c in sorted(self.io_calls.items())),
+            "opcodes: " + ", ".join(f"{o}={c}" for o, c in sorted(self.opcodes.items())),
+            "hot addresses: " + ", ".join(f"{a}={c}" for a, c in self.hot_addresses(count)),
+        ]
+        return "\n".join(lines)
+
+class ProfiledIO(ComputerIO):
+    """io plugin wrapper timing the callbacks of the wrapped io"""
+    def __init__(self, io: ComputerIO, profile: Profile):
+        self.io = io
+        self.profile = profile
+
+    def __getattr__(self, name: str):
+        return getattr(self.io, name)
+
+    def timed(self, name: str, call, *args):
+        """invoke io callback recording the time spent in it"""
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            self.profile.io_time += time.perf_counter() - start
+            self.profile.io_calls[name] = self.profile.io_calls.get(name, 0) + 1
+
+    def provide_input(self) -> int:
+        """provide input from the wrapped io"""
+        return self.timed("provide_input", self.io.provide_input)
+
+    def idle(self) -> bool:
+        """report whether the wrapped io has nothing pending"""
+        return self.io.idle()
+
+    def accept_output(self, o: int):
+        """pass output to the wrapped io"""
+        self.timed("accept_output", self.io.accept_output, o)
+
+
+class ProfiledComputer(Computer):
+    """opt in intcode computer that records an execution profile: per opcode
+    and per address instruction counts, throughput and the split between
+    interpreter and io callback time"""
+    def __init__(self, op: list[int], io: ComputerIO):
+        self.profile = Profile()
+        super().__init__(op, ProfiledIO(io, self.profile))
+
+    def fork(self, io: ComputerIO) -> Self:
+        """clone the computer in its current state attached to the supplied
+        io, profiled separately from this computer
+        >>> c = ProfiledComputer([3, 9, 1001, 9, 1, 9, 4, 9, 99, 0], SignalIO())
+        >>> c.run()
+        0
+        >>> io = SignalIO()
+        >>> io.send([41])
+        >>> f = c.snapshot().fork(io)
+        >>> f.run(), io.receive(), f.profile.instructions
+        (3, [42], 3)
+        >>> print("\\n".join(f.profile.report().splitlines()[2:]))
+        io calls: accept_output=1, provide_input=1
+        opcodes: 1=1, 3=1, 4=1
+        hot addresses: 0=1, 2=1, 6=1
+        """
+        clone = super().fork(io)
+        clone.profile = Profile()
+        if io is not None:
+            clone.io = ProfiledIO(io, clone.profile)
+        return clone
+
+    def execute(self, limit: int) -> int:
+        """execute instructions recording each one in the profile"""
+        profile = self.profile
+        opcodes = profile.opcodes
+        addresses = profile.addresses
+        mem = self.mem
+        i = self.opi
+        steps = 0
+        start = time.perf_counter()
+        try:
+            while i < len(mem) and steps != limit:
+                d = self.decoded.get(i)
+                if d is None:
+                    d = self.decode(i)
+                opcode, modes, handler = d
+                if opcode == 99:
+                    self.done = True
+                    break
+                ni = handler(self, i, modes)
+                if ni is None:
+                    break
+                opcodes[opcode] = opcodes.get(opcode, 0) + 1
+                addresses[i] = addresses.get(i, 0) + 1
+                i = ni
+                steps += 1
+                if self.event is not None:
+                    break
+        except HaltProgram:
+            self.done = True
+        self.opi = i
+        profile.elapsed += time.perf_counter() - start
+        profile.instructions += steps
+        return steps
@@ -1,9 +1,16 @@
 """Module providing a-star search implementation"""
 
+import heapq
+import itertools
+
 class PriorityQueue:
-    """queue ordered by priority value"""
+    """queue ordered by priority value, lowest first (most recently queued
+    first among equal priorities). backed by a binary heap; a value queued
+    again with a better priority leaves its old entry behind, which callers
+    skip when it comes up (lazy deletion)"""
     def __init__(self) -> None:
         self.items = []
+        self.order = itertools.count()
 
     def empty(self) -> bool:
         """determines if queue is empty"""
@@ -11,25 +18,11 @@ class PriorityQueue:
 
     def next(self) -> any:
         """dequeue the next value"""
-        n = len(self.items) - 1
-        item = self.items[n]
-        self.items = self.items[:n]
-        return item[0]
+        return heapq.heappop(self.items)[2]
 
     def queue(self, obj: any, priority: int):
         """place value in the queue based on priority"""
-        qi = (obj, priority)
-
-        idx = -1
-        for i, item in enumerate(self.items):
-            if item[1] < priority:
-                idx = i
-                break
-
-        if idx == -1:
-            self.items.append(qi)
-        else:
-            self.items.insert(idx, qi)
+        heapq.heappush(self.items, (priority, -next(self.order), obj))
 
 class SearchMove:
     """encapsulates the cost and state of a move"""
@@ -77,9 +70,14 @@ class Search:
         q.queue(init.state, init.cost)
         cost = {init.state: init.cost}
         from_state = {}
+        closed = set()
         goal = None
         while not q.empty():
             current = q.next()
+            if current in closed:
+                # stale entry left behind when a cheaper cost was queued
+                continue
+            closed.add(current)
             if self.searcher.is_goal(current):
                 goal = current
                 break
@@ -95,11 +93,44 @@ class Search:
 
         if goal is None:
             return None
+        return SearchSolution(cost[goal], trace_path(from_state, init.state, goal))
 
-        path = [goal]
-        current = goal
-        while current != init.state:
-            current = from_state[current]
-            path.insert(0, current)
-
-        return SearchSolution(cost[goal], path)
+    def sweep(self, init: SearchMove, targets: set) -> dict[any,SearchSolution]:
+        """find the shortest path from the initial move to every reachable
+        target in a single pass, stopping once all have been reached. moves
+        are expanded cheapest first (breadth first when every move costs
+        one step), so weighted graphs are swept too"""
+        q = PriorityQueue()
+        q.queue(init.state, init.cost)
+        cost = {init.state: init.cost}
+        from_state = {}
+        closed = set()
+        remaining = set(targets)
+        while not q.empty() and len(remaining) > 0:
+            current = q.next()
+            if current in closed:
+                continue
+            closed.add(current)
+            remaining.discard(current)
+            for move in self.searcher.possible_moves(current):
+                ncost = cost[current] + move.cost
+                if move.state not in cost or ncost < cost[move.state]:
+                    cost[move.state] = ncost
+                    from_state[move.state] = current
+                    q.queue(move.state, ncost)
+        solutions = {}
+        for target in targets:
+            if target in closed and target != init.state:
+                solutions[target] = SearchSolution(cost[target], \
+                    trace_path(from_state, init.state, target))
+        return solutions
+
+def trace_path(from_state: dict, init, goal) -> list:
+    """rebuild the path to the goal from the state each was reached from"""
+    path = [goal]
+    current = goal
+    while current != init:
+        current = from_state[current]
+        path.append(current)
+    path.reverse()
+    return path
@@ -0,0 +1,79 @@
+"""Module providing parallel sweep over independent intcode runs"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# number of cases handed to a worker at a time
+CHUNK_SIZE = 250
+
+# fewest cases worth starting a process pool for when the number of workers
+# is not given; smaller sweeps run in process
+POOL_THRESHOLD = 50000
+
+# program shared with each worker process by the pool initializer
+WORKER_PROGRAM = None
+
+def sweep(program: list[int], evaluate, cases: list, target=None, workers: int = None) -> list:
+    """run evaluate(program, case) for every case and return the list of
+    (case, result) pairs in case order. when a target is supplied the sweep
+    stops at the first case producing it and only that pair is returned
+    (empty when no case does). the cases are spread over a process pool
+    that receives the program once per worker, with chunks collected in
+    order; a single worker (or, when workers is not given, fewer than
+    POOL_THRESHOLD cases) runs in process to skip the pool overhead.
+    evaluate must be a picklable module level function.
+
+    under the spawn and forkserver start methods (the defaults on macOS,
+    Windows and, from python 3.14, linux) each worker imports the caller's
+    main module, so a script using a pool must guard its entry point with
+    if __name__ == "__main__" or it starts a pool from every worker.
+    >>> def offset(program, case):
+    ...     return program[0] + case
+    >>> sweep([10], offset, [1, 2, 3])
+    [(1, 11), (2, 12), (3, 13)]
+    >>> sweep([10], offset, [3, 2, 1, 2], target=12)
+    [(2, 12)]
+    >>> sweep([10], offset, [1, 2, 3], target=20)
+    []
+    """
+    if workers is None:
+        workers = 1
+        if len(cases) >= POOL_THRESHOLD:
+            workers = os.cpu_count() or 1
+    if workers == 1:
+        return evaluate_chunk(evaluate, program, cases, target)
+    chunks = [cases[i:i+CHUNK_SIZE] for i in range(0, len(cases), CHUNK_SIZE)]
+    results = []
+    pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=(program,))
+    try:
+        futures = [pool.submit(worker_chunk, evaluate, chunk, target) for chunk in chunks]
+        for future in futures:
+            found = future.result()
+            if target is not None and len(found) > 0:
+                return found
+            results.extend(found)
+        return results
+    finally:
+        # an early return leaves later chunks queued or running: drop the
+        # queued ones and let the running ones finish without waiting
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def evaluate_chunk(evaluate, program: list[int], cases: list, target) -> list:
+    """evaluate a chunk of cases, stopping early on the target (if any)"""
+    results = []
+    for case in cases:
+        result = evaluate(program, case)
+        if target is None:
+            results.append((case, result))
+        elif result == target:
+            return [(case, result)]
+    return results
+
+def init_worker(program: list[int]):
+    """store the program in the worker process"""
+    global WORKER_PROGRAM # pylint: disable=global-statement
+    WORKER_PROGRAM = program
+
+def worker_chunk(evaluate, cases: list, target) -> list:
+    """evaluate a chunk of cases against the worker's program"""
+    return evaluate_chunk(evaluate, WORKER_PROGRAM, cases, target)
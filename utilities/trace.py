@@ -0,0 +1,72 @@
+"""Module providing intcode io trace recording and replay"""
+
+from utilities.intcode import ComputerIO, HaltProgram
+from utilities.varint import zigzag, unzigzag, encode_varints, decode_varints
+
+# event kinds, stored in the low bit of each encoded event
+INPUT = 0
+OUTPUT = 1
+
+class TraceRecorder(ComputerIO):
+    """io plugin wrapper recording every input consumed and output produced
+    by the wrapped io"""
+    def __init__(self, io: ComputerIO):
+        self.io = io
+        self.events = []
+
+    def __getattr__(self, name: str):
+        return getattr(self.io, name)
+
+    def provide_input(self) -> int:
+        """provide input from the wrapped io, recording it"""
+        v = self.io.provide_input()
+        if v is not None:
+            self.events.append((INPUT, v))
+        return v
+
+    def accept_output(self, o: int):
+        """record output and pass it to the wrapped io"""
+        self.events.append((OUTPUT, o))
+        self.io.accept_output(o)
+
+    def idle(self) -> bool:
+        """report whether the wrapped io has nothing pending"""
+        return self.io.idle()
+
+    def save(self, filename: str):
+        """write the recorded events to a binary trace file"""
+        with open(filename, "wb") as handle:
+            handle.write(encode_events(self.events))
+
+def replay(filename: str, io: ComputerIO) -> int:
+    """feed the io from a binary trace file without running the program.
+    inputs the io provides are checked against the recorded ones since the
+    recorded outputs only hold while they match. returns the number of
+    events replayed, stopping early when the io raises HaltProgram"""
+    with open(filename, "rb") as handle:
+        events = decode_events(handle.read())
+    for n, (kind, v) in enumerate(events):
+        if kind == OUTPUT:
+            try:
+                io.accept_output(v)
+            except HaltProgram:
+                return n + 1
+            continue
+        provided = io.provide_input()
+        if provided != v:
+            raise ValueError(f"replay diverged at event {n}: expected input {v}, got {provided}")
+    return len(events)
+
+def encode_events(events: list[tuple[int,int]]) -> bytes:
+    """encode events as one zigzag varint each, tagged with its kind
+    >>> encode_events([(INPUT, 1), (OUTPUT, -1), (OUTPUT, 300)])
+    b'\\x04\\x03\\xb1\\t'
+    """
+    return encode_varints(zigzag(v) << 1 | kind for kind, v in events)
+
+def decode_events(data: bytes) -> list[tuple[int,int]]:
+    """decode events encoded by encode_events
+    >>> decode_events(encode_events([(INPUT, 1), (OUTPUT, -1), (OUTPUT, 300)]))
+    [(0, 1), (1, -1), (1, 300)]
+    """
+    return [(n & 1, unzigzag(n >> 1)) for n in decode_varints(data)]
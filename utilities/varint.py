@@ -0,0 +1,46 @@
+"""Module providing the varint encoding shared by the intcode file formats"""
+
+def zigzag(v: int) -> int:
+    """map a signed value onto an unsigned one, small magnitudes first
+    >>> [zigzag(v) for v in (0, -1, 1, -2, 2)]
+    [0, 1, 2, 3, 4]
+    """
+    return (v << 1) if v >= 0 else ((-v << 1) - 1)
+
+def unzigzag(n: int) -> int:
+    """reverse zigzag
+    >>> [unzigzag(n) for n in (0, 1, 2, 3, 4)]
+    [0, -1, 1, -2, 2]
+    """
+    return (n >> 1) if n & 1 == 0 else -((n + 1) >> 1)
+
+def encode_varints(values) -> bytes:
+    """encode unsigned values as little endian base 128 varints
+    >>> encode_varints([2, 1, 600])
+    b'\\x02\\x01\\xd8\\x04'
+    """
+    out = bytearray()
+    for n in values:
+        while n > 0x7f:
+            out.append((n & 0x7f) | 0x80)
+            n >>= 7
+        out.append(n)
+    return bytes(out)
+
+def decode_varints(data: bytes) -> list[int]:
+    """decode values encoded by encode_varints
+    >>> decode_varints(encode_varints([2, 1, 600]))
+    [2, 1, 600]
+    """
+    values = []
+    n = 0
+    shift = 0
+    for b in data:
+        n |= (b & 0x7f) << shift
+        shift += 7
+        if b & 0x80:
+            continue
+        values.append(n)
+        n = 0
+        shift = 0
+    return values